@@ -0,0 +1,9 @@
+"""
+Vercel serverless function handler
+"""
+
+# The Vercel Python runtime serves ASGI apps natively, so the FastAPI app
+# is exported directly with no Mangum event translation per request.
+# Importing at module load runs FastAPI/Pydantic setup during the function
+# init phase (boosted CPU) rather than on the first billed request.
+from backend.api.main import app
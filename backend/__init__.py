@@ -1,11 +1,3 @@
 """
 FIBO Studio Backend
 """
-
-import sys
-from pathlib import Path
-
-# Add backend to path for imports
-backend_dir = Path(__file__).parent
-if str(backend_dir) not in sys.path:
-    sys.path.insert(0, str(backend_dir))
@@ -2,35 +2,106 @@
 FastAPI Main Application
 """
 
-from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi import FastAPI, UploadFile, File, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, JSONResponse, Response
+from starlette.background import BackgroundTask
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from contextlib import asynccontextmanager, contextmanager
+import asyncio
+import functools
 import uuid
-import json
+import orjson
 from datetime import datetime
 import os
 import tempfile
 import shutil
 from pathlib import Path
 import sys
+import threading
 from io import BytesIO
-import base64
+try:
+    # SIMD-accelerated base64 for the large image payloads, when installed
+    import pybase64 as base64
+except ImportError:
+    import base64
+import re
+try:
+    # Cross-process lock for the saved storyboards index (POSIX only)
+    import fcntl
+except ImportError:
+    fcntl = None
+try:
+    # MessagePack responses for clients that ask for them (JSON otherwise)
+    import msgpack
+except ImportError:
+    msgpack = None
 # PIL Image imported lazily when needed to speed up startup
 
-# Add backend directory to path for imports
-backend_dir = Path(__file__).parent.parent
-if str(backend_dir) not in sys.path:
-    sys.path.insert(0, str(backend_dir))
+# Add backend directory to path for imports (a duplicate entry is harmless
+# and cheaper than scanning sys.path first)
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
 
 # Lazy imports - don't import heavy modules at startup
 # This significantly speeds up application startup time
 
+
+# Modules the request handlers import lazily. Loading them once in the
+# lifespan means the first export/edit request finds them in sys.modules
+# instead of paying their import time.
+_WARM_MODULES = (
+    "PIL.Image",
+    "core.fibo_engine",
+    "core.storyboard",
+    "core.bria_client",
+    "core.scene_library",
+    "reportlab.platypus",
+    "cv2",
+)
+
+
+def _warm_imports():
+    """Import the handlers' lazily-loaded modules, skipping optional ones"""
+    import importlib
+    
+    for module_name in _WARM_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            # Optional export dependency - handlers report it when used
+            pass
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build shared services once per process instead of on first request"""
+    await asyncio.to_thread(_warm_imports)
+    # Handlers reach these through the lazy getters - building them here just
+    # moves the cost out of the first request
+    await asyncio.to_thread(get_script_processor)
+    bria_client = await asyncio.to_thread(get_bria_client)
+    await asyncio.to_thread(get_fibo_generator)
+    if bria_client is not None:
+        # Connect to BRIA in the background (the generator shares this client)
+        bria_client.warm_up()
+    await asyncio.to_thread(get_scene_library)
+    await asyncio.to_thread(get_saved_storyboards_dir)
+    
+    yield
+    
+    # Release the pooled BRIA connections
+    if _bria_client is not None:
+        _bria_client.close()
+
+
 app = FastAPI(
     title="FIBO Studio API",
     description="AI-Powered Cinematic Pre-Visualization Pipeline",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # CORS middleware for frontend
@@ -42,17 +113,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON responses - storyboard payloads run to megabytes and the
+# network, not the server, is the bottleneck for them
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Lazy initialization of services - only create when needed
 # This prevents blocking server startup
 _script_processor = None
 _llm_translator = None
 
+# Guards the lazy getters so concurrent first requests (and worker threads)
+# never build a service twice
+_init_lock = threading.RLock()
+
 def get_script_processor():
     """Lazy initialization of script processor"""
     global _script_processor
     if _script_processor is None:
-        from core.script_parser import ScriptProcessor
-        _script_processor = ScriptProcessor()
+        with _init_lock:
+            if _script_processor is None:
+                from core.script_parser import ScriptProcessor
+                _script_processor = ScriptProcessor()
     return _script_processor
 
 def get_llm_translator(provider="bria"):
@@ -62,35 +143,71 @@ def get_llm_translator(provider="bria"):
     from core.llm_translator import LLMTranslator
     return LLMTranslator(provider=provider)
 
+@functools.lru_cache(maxsize=64)
+def _parse_script_cached(content: str) -> List:
+    """
+    Parse script content, reusing the result for recently seen scripts
+    
+    Parsing is a pure function of the text, and the editor re-sends the same
+    script to parse-script, generate-storyboard and the export endpoints
+    while only the generation options change.
+    """
+    return get_script_processor().parse_script_content(content)
+
 # Initialize FIBO generator lazily (only when needed)
 # This prevents blocking server startup if model loading takes time
 fibo_generator = None
 
+def _create_fibo_generator():
+    """Build the FIBO generator, falling back to placeholder mode on failure"""
+    from core.fibo_engine import FIBOGenerator
+    
+    bria_api_token = os.getenv("BRIA_API_TOKEN")
+    try:
+        # Shares the endpoints' BRIA client, so there is one connection pool
+        return FIBOGenerator(
+            api_token=bria_api_token,
+            hdr_enabled=True,
+            image_width=1920,
+            image_height=1080,
+            bria_client=get_bria_client()
+        )
+    except Exception as e:
+        print(f"Warning: Failed to initialize FIBO generator: {e}")
+        # Create a minimal generator that will use placeholder mode
+        return FIBOGenerator(
+            api_token=None,
+            hdr_enabled=True,
+            image_width=1920,
+            image_height=1080
+        )
+
 def get_fibo_generator():
     """Lazy initialization of FIBO generator"""
     global fibo_generator
     if fibo_generator is None:
-        bria_api_token = os.getenv("BRIA_API_TOKEN")
-        try:
-            from core.fibo_engine import FIBOGenerator
-            fibo_generator = FIBOGenerator(
-                api_token=bria_api_token,
-                hdr_enabled=True,
-                image_width=1920,
-                image_height=1080
-            )
-        except Exception as e:
-            print(f"Warning: Failed to initialize FIBO generator: {e}")
-            # Create a minimal generator that will use placeholder mode
-            from core.fibo_engine import FIBOGenerator
-            fibo_generator = FIBOGenerator(
-                api_token=None,
-                hdr_enabled=True,
-                image_width=1920,
-                image_height=1080
-            )
+        with _init_lock:
+            if fibo_generator is None:
+                fibo_generator = _create_fibo_generator()
     return fibo_generator
 
+# Shared BRIA client for the edit/animatic/enhance endpoints, so every
+# request reuses one client instead of building its own
+_bria_client = None
+
+def get_bria_client():
+    """Lazy initialization of BRIA API client (None without a token)"""
+    global _bria_client
+    if _bria_client is None:
+        bria_api_token = os.getenv("BRIA_API_TOKEN")
+        if not bria_api_token:
+            return None
+        with _init_lock:
+            if _bria_client is None:
+                from core.bria_client import BRIAAPIClient
+                _bria_client = BRIAAPIClient(api_token=bria_api_token)
+    return _bria_client
+
 # Output directory - lazy initialization for faster startup
 _OUTPUT_DIR = None
 
@@ -116,6 +233,548 @@ def get_output_dir():
 # For backward compatibility, create OUTPUT_DIR variable
 OUTPUT_DIR = get_output_dir()
 
+# Saved scene library - SQLite index opened on first use
+_scene_library = None
+
+def get_scene_library():
+    """Lazy initialization of the saved scene library"""
+    global _scene_library
+    if _scene_library is None:
+        with _init_lock:
+            if _scene_library is None:
+                from core.scene_library import SceneLibrary
+                try:
+                    _scene_library = SceneLibrary(get_output_dir() / "saved_scenes")
+                except (OSError, PermissionError):
+                    # Fallback to /tmp if OUTPUT_DIR is read-only
+                    _scene_library = SceneLibrary(Path("/tmp/outputs/saved_scenes"))
+    return _scene_library
+
+# Saved storyboards directory - resolved and created once
+_SAVED_STORYBOARDS_DIR = None
+
+def get_saved_storyboards_dir():
+    """Get saved storyboards directory, creating it if needed"""
+    global _SAVED_STORYBOARDS_DIR
+    if _SAVED_STORYBOARDS_DIR is None:
+        with _init_lock:
+            if _SAVED_STORYBOARDS_DIR is None:
+                saved_dir = get_output_dir() / "saved_storyboards"
+                try:
+                    saved_dir.mkdir(parents=True, exist_ok=True)
+                except (OSError, PermissionError):
+                    # Fallback to /tmp if OUTPUT_DIR is read-only
+                    saved_dir = Path("/tmp/outputs/saved_storyboards")
+                    saved_dir.mkdir(parents=True, exist_ok=True)
+                # Files saved by older versions may lack frame fields that the
+                # saved storyboard route no longer fills in when sending them
+                with _storyboard_index_locked(saved_dir):
+                    _migrate_storyboard_files(saved_dir)
+                _SAVED_STORYBOARDS_DIR = saved_dir
+    return _SAVED_STORYBOARDS_DIR
+
+
+# Blocking helpers - route handlers run these via asyncio.to_thread so file
+# I/O and image encoding never stall the event loop (orjson handles the
+# megabyte-scale base64 strings in saved storyboards far faster than json)
+def _write_json(path: Path, data: Dict):
+    """Write data as compact JSON to path, atomically so readers never see a partial file"""
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE))
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: Path) -> Dict:
+    """Read JSON data from path"""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def _wants_msgpack(request: Request) -> bool:
+    """Whether the client asked for MessagePack (and it can be produced)"""
+    return msgpack is not None and "application/msgpack" in request.headers.get("accept", "")
+
+
+def _binary_image(image: Any) -> Any:
+    """Inline data URL images as raw bytes, which MessagePack carries without base64"""
+    if isinstance(image, str) and image.startswith("data:"):
+        return _image_bytes(image)
+    return image
+
+
+def _msgpack_response(path: Path) -> Response:
+    """Re-encode a saved storyboard (or the list index) JSON file as MessagePack"""
+    data = _read_json(path)
+    for frame in data.get("frames") or []:
+        frame["image"] = _binary_image(frame.get("image"))
+    for entry in [data] + (data.get("storyboards") or []):
+        if "thumbnail" in entry:
+            entry["thumbnail"] = _binary_image(entry["thumbnail"])
+    return Response(
+        content=msgpack.packb(data, use_bin_type=True),
+        media_type="application/msgpack",
+        headers={"Vary": "Accept"}
+    )
+
+
+def _json_file_response(request: Request, path: Path, stat_result: os.stat_result) -> Response:
+    """Send a saved JSON file, or 304 Not Modified if the client's copy is current"""
+    # Weak, since the gzip middleware may change the bytes on the wire
+    etag = f'W/"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+    headers = {"ETag": etag, "Vary": "Accept"}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type="application/json", headers=headers, stat_result=stat_result)
+
+
+# Saved storyboard IDs are UUIDs - anything else is rejected before a path is
+# built from it (which also keeps "_index" and "../" out of reach)
+_STORYBOARD_ID = re.compile(r'\A[A-Za-z0-9][A-Za-z0-9_-]{0,63}\Z')
+
+
+def _check_storyboard_id(storyboard_id: str):
+    """Raise a 400 error for a storyboard ID that could not have been saved"""
+    if not _STORYBOARD_ID.match(storyboard_id):
+        raise HTTPException(status_code=400, detail="Invalid storyboard ID")
+
+
+# Saved storyboards list index - a sidecar file holding the list response, so
+# listing never has to parse every storyboard. It is only a cache: entries are
+# reconciled with the storyboard files on each read, so files added or removed
+# outside this process (or a failed index update) never go missing from the list.
+STORYBOARD_INDEX_NAME = "_index.json"
+STORYBOARD_INDEX_LOCK_NAME = "_index.lock"
+_storyboard_index_lock = threading.Lock()
+
+
+@contextmanager
+def _storyboard_index_locked(saved_dir: Path):
+    """Hold the index lock - across threads, and across worker processes where flock exists"""
+    with _storyboard_index_lock:
+        if fcntl is None:
+            yield
+            return
+        with open(saved_dir / STORYBOARD_INDEX_LOCK_NAME, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _storyboard_summary(storyboard_data: Dict, default_id: str) -> Dict:
+    """Essential info about a saved storyboard for the list view"""
+    return {
+        "id": storyboard_data.get("id", default_id),
+        "name": storyboard_data.get("name", "Unnamed Storyboard"),
+        "frame_count": storyboard_data.get("frame_count", 0),
+        "created_at": storyboard_data.get("created_at"),
+        "updated_at": storyboard_data.get("updated_at"),
+        "thumbnail": storyboard_data.get("thumbnail")
+    }
+
+
+def _normalize_storyboard(storyboard_data: Dict, storyboard_id: str) -> Dict:
+    """
+    Storyboard data in the shape the viewer expects
+    
+    Every frame gets scene_number, image and params (numbered from 1, an empty
+    image and no params when missing) and the storyboard gets a name and id,
+    so saved files can be sent from disk as they are.
+    
+    Args:
+        storyboard_data: Storyboard as posted or read from a saved file
+        storyboard_id: ID to use if the data has none
+    
+    Returns:
+        Normalized copy of the storyboard data
+    """
+    frames = []
+    for index, frame in enumerate(storyboard_data.get("frames") or []):
+        scene_number = frame.get("scene_number")
+        frames.append({
+            "scene_number": index + 1 if scene_number is None else scene_number,
+            "image": frame.get("image") or "",
+            "params": frame.get("params") or {}
+        })
+    
+    return {
+        **storyboard_data,
+        "id": storyboard_data.get("id") or storyboard_id,
+        "name": storyboard_data.get("name") or "Unnamed Storyboard",
+        "frames": frames,
+        "frame_count": storyboard_data.get("frame_count", len(frames)),
+        "script_content": storyboard_data.get("script_content")
+    }
+
+
+def _migrate_storyboard_files(saved_dir: Path):
+    """Rewrite saved storyboard files from before frames were normalized on save"""
+    for storyboard_id in _storyboard_file_ids(saved_dir):
+        path = saved_dir / f"{storyboard_id}.json"
+        try:
+            storyboard_data = _read_json(path)
+            normalized = _normalize_storyboard(storyboard_data, storyboard_id)
+            if normalized != storyboard_data:
+                _write_json(path, normalized)
+        except Exception as e:
+            print(f"Error migrating {path}: {e}")
+
+
+def _read_storyboard_summary(path: str) -> Optional[Dict]:
+    """Read one saved storyboard file into its summary (None if unreadable)"""
+    try:
+        return _storyboard_summary(_read_json(path), os.path.basename(path)[:-len(".json")])
+    except Exception as e:
+        print(f"Error reading {path}: {e}")
+        return None
+
+
+def _read_storyboard_summaries(paths: List[str]) -> List[Dict]:
+    """Read the summaries of several storyboard files, in parallel"""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    if not paths:
+        return []
+    
+    # File reads release the GIL, so the I/O for several files overlaps
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        summaries = list(executor.map(_read_storyboard_summary, paths))
+    
+    return [summary for summary in summaries if summary is not None]
+
+
+def _storyboard_file_ids(saved_dir: Path) -> set:
+    """IDs of the storyboard files in the saved storyboards directory"""
+    with os.scandir(saved_dir) as entries:
+        return {
+            entry.name[:-len(".json")] for entry in entries
+            if entry.name.endswith(".json") and entry.name != STORYBOARD_INDEX_NAME
+        }
+
+
+def _reconcile_storyboard_index(saved_dir: Path, storyboards: List[Dict]) -> Tuple[List[Dict], bool]:
+    """
+    Bring index entries in line with the storyboard files on disk
+    
+    Entries whose file is gone are dropped and files without an entry are
+    read, so only storyboards the index doesn't know about are parsed.
+    
+    Returns:
+        The reconciled entries, and whether they differ from the ones given
+    """
+    file_ids = _storyboard_file_ids(saved_dir)
+    kept = [item for item in storyboards if item.get("id") in file_ids]
+    new_ids = file_ids.difference(item.get("id") for item in kept)
+    added = _read_storyboard_summaries([str(saved_dir / f"{i}.json") for i in new_ids])
+    return kept + added, len(kept) != len(storyboards) or bool(new_ids)
+
+
+def _load_storyboard_index(saved_dir: Path) -> Tuple[List[Dict], bool]:
+    """Index entries reconciled with the storyboard files, and whether the index needs rewriting"""
+    try:
+        storyboards = _read_json(saved_dir / STORYBOARD_INDEX_NAME)["storyboards"]
+        stale = False
+    except (OSError, ValueError, KeyError, TypeError):
+        # Missing or unreadable - rebuilt from the storyboard files
+        storyboards = []
+        stale = True
+    storyboards, changed = _reconcile_storyboard_index(saved_dir, storyboards)
+    return storyboards, stale or changed
+
+
+def _write_storyboard_index(saved_dir: Path, storyboards: List[Dict]):
+    """Write the index in the list response shape"""
+    # Sort by created_at (newest first)
+    storyboards.sort(key=lambda x: x.get("created_at") or "", reverse=True)
+    _write_json(saved_dir / STORYBOARD_INDEX_NAME, {
+        "status": "success",
+        "storyboards": storyboards,
+        "count": len(storyboards)
+    })
+
+
+def _storyboard_index_path(saved_dir: Path) -> Path:
+    """Path of the list index, rewriting it first if it is out of step with the storyboard files"""
+    index_path = saved_dir / STORYBOARD_INDEX_NAME
+    if _load_storyboard_index(saved_dir)[1]:
+        with _storyboard_index_locked(saved_dir):
+            storyboards, stale = _load_storyboard_index(saved_dir)
+            if stale:
+                _write_storyboard_index(saved_dir, storyboards)
+    return index_path
+
+
+def _update_storyboard_index(saved_dir: Path, add: Optional[Dict] = None, remove_ids: List[str] = ()):
+    """
+    Add or remove storyboards in the list index (one rewrite for the whole batch)
+    
+    If the update fails the index is deleted, so the next list rebuilds it
+    from the storyboard files rather than serving a list missing this change.
+    
+    Args:
+        saved_dir: Saved storyboards directory
+        add: Summary of a storyboard to add (replacing any entry with its ID)
+        remove_ids: IDs of storyboards to remove
+    """
+    index_path = saved_dir / STORYBOARD_INDEX_NAME
+    with _storyboard_index_locked(saved_dir):
+        try:
+            try:
+                storyboards = _read_json(index_path)["storyboards"]
+            except (OSError, ValueError, KeyError, TypeError):
+                storyboards = []
+            drop_ids = set(remove_ids)
+            if add:
+                drop_ids.add(add["id"])
+            storyboards = [item for item in storyboards if item.get("id") not in drop_ids]
+            if add:
+                storyboards.append(add)
+            # Also picks up changes made outside this worker
+            storyboards, _ = _reconcile_storyboard_index(saved_dir, storyboards)
+            _write_storyboard_index(saved_dir, storyboards)
+        except Exception:
+            try:
+                index_path.unlink()
+            except FileNotFoundError:
+                pass
+            raise
+
+
+def _delete_storyboard_files(saved_dir: Path, storyboard_id: str) -> bool:
+    """Delete a saved storyboard's JSON file and frame images (False if it did not exist)"""
+    try:
+        (saved_dir / f"{storyboard_id}.json").unlink()
+    except FileNotFoundError:
+        return False
+    shutil.rmtree(saved_dir / storyboard_id, ignore_errors=True)
+    return True
+
+
+# Frame images of saved storyboards are stored as files next to the storyboard
+# JSON (saved_dir/{id}/frame_{n}.{ext}) and referenced by URL, which keeps the
+# JSON small and lets the browser fetch and cache each image separately
+_SAVED_FRAME_NAME = re.compile(r'^frame_\d+\.(png|jpeg|webp)$')
+_SAVED_FRAME_URL = re.compile(r'^/api/saved-storyboard/([\w-]+)/frames/([^/]+)$')
+_IMAGE_EXTENSIONS = {"image/png": "png", "image/jpeg": "jpeg", "image/jpg": "jpeg", "image/webp": "webp"}
+
+
+def _saved_frame_url(storyboard_id: str, filename: str) -> str:
+    """URL (relative to the API) serving a saved storyboard frame image"""
+    return f"/api/saved-storyboard/{storyboard_id}/frames/{filename}"
+
+
+def _saved_frame_path(image: str) -> Optional[Path]:
+    """Local file behind a saved storyboard frame URL, or None for any other image"""
+    match = _SAVED_FRAME_URL.match(image)
+    if not match or not _SAVED_FRAME_NAME.match(match.group(2)):
+        return None
+    return get_saved_storyboards_dir() / match.group(1) / match.group(2)
+
+
+# Posted data URL images ("data:image/png;base64,...")
+_DATA_URL = re.compile(r'\Adata:(image/[\w.+-]+);base64,')
+
+
+def _sniff_image_type(data: bytes) -> Optional[str]:
+    """MIME type of PNG, JPEG or WebP image bytes (None for anything else)"""
+    if data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if data.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+def _posted_image(image: str) -> Tuple[str, bytes]:
+    """
+    MIME type and raw bytes of a posted image
+    
+    Accepts a PNG, JPEG or WebP data URL, a saved storyboard frame URL, or
+    bare base64 of a PNG, JPEG or WebP image. Anything else (other URLs,
+    other image types, malformed base64) is rejected with a 400 error
+    instead of being decoded into bytes that are not an image.
+    """
+    if not isinstance(image, str):
+        raise HTTPException(status_code=400, detail="Image must be a data URL or base64 string")
+    
+    frame_path = _saved_frame_path(image)
+    if frame_path is not None:
+        try:
+            return "image/" + frame_path.suffix[1:], frame_path.read_bytes()
+        except FileNotFoundError:
+            raise HTTPException(status_code=400, detail="Saved frame image not found")
+    
+    match = _DATA_URL.match(image)
+    if match:
+        mime_type = match.group(1)
+        if mime_type not in _IMAGE_EXTENSIONS:
+            raise HTTPException(status_code=400, detail=f"Unsupported image type: {mime_type}")
+        payload = image[match.end():]
+    elif image.startswith("data:"):
+        raise HTTPException(status_code=400, detail="Image data URL must be a base64 image")
+    else:
+        mime_type = None
+        payload = image
+    
+    try:
+        data = base64.b64decode(payload, validate=True)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid base64 image data")
+    if not data:
+        raise HTTPException(status_code=400, detail="Empty image")
+    
+    if mime_type is None:
+        mime_type = _sniff_image_type(data)
+        if mime_type is None:
+            raise HTTPException(status_code=400, detail="Image must be PNG, JPEG or WebP")
+    return mime_type, data
+
+
+def _posted_data_url(image: str) -> str:
+    """A posted image as a data URL - as posted if it is one, else built from the frame file or base64"""
+    match = _DATA_URL.match(image) if isinstance(image, str) else None
+    if match and match.group(1) in _IMAGE_EXTENSIONS:
+        return image
+    mime_type, data = _posted_image(image)
+    return f"data:{mime_type};base64,{base64.b64encode(data).decode('ascii')}"
+
+
+def _image_bytes(image: str) -> bytes:
+    """Raw bytes of a posted image - a data URL, bare base64 or saved frame URL"""
+    return _posted_image(image)[1]
+
+
+def _externalize_frame_images(saved_dir: Path, storyboard_id: str, frames: List[Dict]) -> List[Dict]:
+    """
+    Write the images of frames being saved to files
+    
+    Args:
+        saved_dir: Saved storyboards directory
+        storyboard_id: ID of the storyboard being saved
+        frames: Frames as posted (data URL or base64 images, or frame URLs of
+            another saved storyboard when a loaded storyboard is saved again)
+    
+    Returns:
+        Frames with each image replaced by its saved frame URL
+    """
+    frame_dir = saved_dir / storyboard_id
+    saved_frames = []
+    try:
+        for index, frame in enumerate(frames):
+            image = frame.get("image")
+            if image:
+                mime_type, image_bytes = _posted_image(image)
+                filename = f"frame_{index}.{_IMAGE_EXTENSIONS[mime_type]}"
+                
+                frame_dir.mkdir(exist_ok=True)
+                (frame_dir / filename).write_bytes(image_bytes)
+                frame = {**frame, "image": _saved_frame_url(storyboard_id, filename)}
+            saved_frames.append(frame)
+    except Exception:
+        # Don't leave the images of a storyboard that was never saved behind
+        shutil.rmtree(frame_dir, ignore_errors=True)
+        raise
+    return saved_frames
+
+
+# Scratch directory for rendered exports, private to this process and removed
+# when it exits (outputs/ is only for data that should persist)
+_export_dir = None
+
+def _get_export_dir() -> str:
+    """Get the per-process export scratch directory, creating it if needed"""
+    global _export_dir
+    if _export_dir is None:
+        with _init_lock:
+            if _export_dir is None:
+                _export_dir = tempfile.TemporaryDirectory(prefix="fibo-exports-")
+    return _export_dir.name
+
+
+def _temp_output_path(suffix: str) -> str:
+    """Create a unique per-request file in the export scratch directory"""
+    fd, path = tempfile.mkstemp(suffix=suffix, dir=_get_export_dir())
+    os.close(fd)
+    return path
+
+
+def _remove_file(path: str):
+    """Delete a temporary output file, ignoring one that is already gone"""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _video_response(video_path: str, filename: str) -> FileResponse:
+    """Send a rendered video and delete it once the response has been sent"""
+    return FileResponse(
+        path=video_path,
+        media_type="video/mp4",
+        filename=filename,
+        background=BackgroundTask(_remove_file, video_path)
+    )
+
+
+class OrjsonResponse(Response):
+    """
+    JSON response rendered straight from plain dicts with orjson
+    
+    Returning one skips FastAPI's jsonable_encoder pass, which dominates the
+    cost of the storyboard payloads full of base64 frame strings.
+    """
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _saved_scene_image_url(scene_id: str) -> str:
+    """URL (relative to the API) serving a saved scene's PNG image"""
+    return f"/api/saved-scene/{scene_id}/image"
+
+
+def _require_bria_client():
+    """Get the shared BRIA client, failing the same way a missing token always has"""
+    bria_client = get_bria_client()
+    if bria_client is None:
+        raise ValueError("BRIA_API_TOKEN is required. Set it in .env or pass as parameter.")
+    return bria_client
+
+
+# Response builders - the data comes from our own parser/generator, so the
+# models are built with model_construct and skip per-item validation
+def _scene_responses(scenes: List) -> List["SceneResponse"]:
+    """Convert parsed scenes into response models"""
+    return [
+        SceneResponse.model_construct(
+            number=scene.number,
+            location=scene.location,
+            description=scene.description,
+            visual_notes=scene.visual_notes,
+            characters=scene.characters
+        )
+        for scene in scenes
+    ]
+
+
+def _frame_responses(frames: List) -> List["FrameResponse"]:
+    """Encode storyboard frames into response models"""
+    from core.fibo_engine import encode_frames
+    
+    encode_frames(frames)
+    return [
+        FrameResponse.model_construct(
+            scene_number=frame.scene_number,
+            image=frame.to_dict()["image"],
+            params=frame.params
+        )
+        for frame in frames
+    ]
+
 
 # Request/Response Models
 class ScriptParseRequest(BaseModel):
@@ -175,6 +834,65 @@ class EnhanceStoryboardRequest(BaseModel):
     upscale_factor: Optional[int] = 2
 
 
+def _decode_export_frame(frame_data: Any):
+    """Decode one frame posted to export-pdf (dict or object) into a Frame, or None"""
+    from PIL import Image
+    from core.fibo_engine import Frame
+    
+    # Handle both dict and object formats
+    if isinstance(frame_data, dict):
+        image_data = frame_data.get("image", "")
+        scene_number = frame_data.get("scene_number", 0)
+        params = frame_data.get("params", {})
+        # Check if description is directly in frame_data (fallback)
+        if "description" in frame_data and "scene_description" not in params:
+            params = params.copy() if params else {}
+            params["scene_description"] = frame_data.get("description")
+    else:
+        # If it's a FrameResponse object, convert to dict
+        image_data = frame_data.image if hasattr(frame_data, 'image') else ""
+        scene_number = frame_data.scene_number if hasattr(frame_data, 'scene_number') else 0
+        params = frame_data.params if hasattr(frame_data, 'params') else {}
+        # Check if description is directly in frame_data (fallback)
+        if hasattr(frame_data, 'description') and "scene_description" not in params:
+            params = params.copy() if params else {}
+            params["scene_description"] = frame_data.description
+    
+    if not image_data:
+        return None
+    
+    try:
+        # Decode to PIL Image (load() forces the pixel decode here, in the
+        # worker thread, rather than later during PDF layout)
+        img_bytes = _image_bytes(image_data) if isinstance(image_data, str) else base64.b64decode(image_data)
+        img = Image.open(BytesIO(img_bytes))
+        img.load()
+        
+        # Create Frame object
+        return Frame(
+            scene_number=scene_number,
+            image=img,
+            params=params if params else {}
+        )
+    except Exception as e:
+        print(f"Error processing frame {scene_number}: {e}")
+        return None
+
+
+def _decode_export_frames(frames: List[Any]) -> List:
+    """Decode frames posted to export-pdf into Frame objects, in parallel"""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    if not frames:
+        return []
+    
+    # base64 and PNG decoding release the GIL, so frames decode concurrently
+    with ThreadPoolExecutor(max_workers=min(8, len(frames))) as executor:
+        decoded = list(executor.map(_decode_export_frame, frames))
+    
+    return [frame for frame in decoded if frame is not None]
+
+
 # API Routes
 @app.get("/")
 async def root():
@@ -183,8 +901,9 @@ async def root():
 
 
 @app.get("/health")
+@app.get("/api/health")
 async def health():
-    """Health check"""
+    """Health check (also used as the readiness probe - must stay cheap)"""
     return {"status": "healthy"}
 
 
@@ -200,19 +919,9 @@ async def parse_script(request: ScriptParseRequest):
         List of parsed scenes
     """
     try:
-        script_processor = get_script_processor()
-        scenes = script_processor.parse_script_content(request.content)
-        
-        return [
-            SceneResponse(
-                number=scene.number,
-                location=scene.location,
-                description=scene.description,
-                visual_notes=scene.visual_notes,
-                characters=scene.characters
-            )
-            for scene in scenes
-        ]
+        scenes = await asyncio.to_thread(_parse_script_cached, request.content)
+        
+        return _scene_responses(scenes)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -229,28 +938,17 @@ async def upload_script(file: UploadFile = File(...)):
         List of parsed scenes
     """
     try:
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".txt") as tmp_file:
-            shutil.copyfileobj(file.file, tmp_file)
-            tmp_path = tmp_file.name
+        # Read the upload straight into memory - scripts are plain text, so
+        # there is no need to copy them to a temp file and read them back
+        raw = await file.read()
+        
+        # Decode like the old text-mode file read did, including newline translation
+        content = raw.decode('utf-8', errors='replace').replace('\r\n', '\n').replace('\r', '\n')
         
         # Parse script
-        script_processor = get_script_processor()
-        scenes = script_processor.parse_script(tmp_path)
-        
-        # Clean up
-        os.unlink(tmp_path)
-        
-        return [
-            SceneResponse(
-                number=scene.number,
-                location=scene.location,
-                description=scene.description,
-                visual_notes=scene.visual_notes,
-                characters=scene.characters
-            )
-            for scene in scenes
-        ]
+        scenes = await asyncio.to_thread(_parse_script_cached, content)
+        
+        return _scene_responses(scenes)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -268,8 +966,7 @@ async def generate_storyboard(request: GenerateRequest):
     """
     try:
         # Parse script
-        script_processor = get_script_processor()
-        scenes = script_processor.parse_script_content(request.script_content)
+        scenes = await asyncio.to_thread(_parse_script_cached, request.script_content)
         
         if not scenes:
             raise HTTPException(status_code=400, detail="No scenes found in script")
@@ -277,23 +974,17 @@ async def generate_storyboard(request: GenerateRequest):
         # Initialize translator with specified provider
         translator = get_llm_translator(provider=request.llm_provider)
         
-        # Generate storyboard with custom parameters if provided
+        # Generate storyboard (custom parameters override defaults if provided)
         generator = get_fibo_generator()
-        if request.custom_params:
-            # Override default parameters with custom ones
-            storyboard = generator.create_storyboard(scenes, translator, custom_params=request.custom_params)
-        else:
-            storyboard = generator.create_storyboard(scenes, translator)
+        # Frames are PNG-encoded by the generation workers as each one finishes
+        storyboard = await asyncio.to_thread(
+            generator.create_storyboard, scenes, translator,
+            custom_params=request.custom_params,
+            encode_frames=True
+        )
         
         # Convert to response format
-        frame_responses = [
-            FrameResponse(
-                scene_number=frame.scene_number,
-                image=frame.to_dict()["image"],
-                params=frame.params
-            )
-            for frame in storyboard.frames
-        ]
+        frame_responses = await asyncio.to_thread(_frame_responses, storyboard.frames)
         
         return StoryboardResponse(
             frames=frame_responses,
@@ -315,10 +1006,6 @@ async def export_pdf(request: ExportPDFRequest):
         PDF file download
     """
     try:
-        from PIL import Image
-        from io import BytesIO
-        import base64
-        from core.fibo_engine import Frame
         from core.storyboard import Storyboard
         
         # Extract values from request
@@ -335,49 +1022,7 @@ async def export_pdf(request: ExportPDFRequest):
         # If frames are provided, use them directly (fast path)
         if frames and len(frames) > 0:
             # Convert frame dictionaries to Frame objects
-            frame_objects = []
-            for frame_data in frames:
-                # Handle both dict and object formats
-                if isinstance(frame_data, dict):
-                    image_data = frame_data.get("image", "")
-                    scene_number = frame_data.get("scene_number", 0)
-                    params = frame_data.get("params", {})
-                    # Check if description is directly in frame_data (fallback)
-                    if "description" in frame_data and "scene_description" not in params:
-                        params = params.copy() if params else {}
-                        params["scene_description"] = frame_data.get("description")
-                else:
-                    # If it's a FrameResponse object, convert to dict
-                    image_data = frame_data.image if hasattr(frame_data, 'image') else ""
-                    scene_number = frame_data.scene_number if hasattr(frame_data, 'scene_number') else 0
-                    params = frame_data.params if hasattr(frame_data, 'params') else {}
-                    # Check if description is directly in frame_data (fallback)
-                    if hasattr(frame_data, 'description') and "scene_description" not in params:
-                        params = params.copy() if params else {}
-                        params["scene_description"] = frame_data.description
-                
-                if not image_data:
-                    continue
-                
-                # Remove data URL prefix if present
-                if isinstance(image_data, str) and image_data.startswith("data:image"):
-                    image_data = image_data.split(",")[1]
-                
-                try:
-                    # Decode base64 to PIL Image
-                    img_bytes = base64.b64decode(image_data)
-                    img = Image.open(BytesIO(img_bytes))
-                    
-                    # Create Frame object
-                    frame = Frame(
-                        scene_number=scene_number,
-                        image=img,
-                        params=params if params else {}
-                    )
-                    frame_objects.append(frame)
-                except Exception as e:
-                    print(f"Error processing frame {scene_number}: {e}")
-                    continue
+            frame_objects = await asyncio.to_thread(_decode_export_frames, frames)
             
             if not frame_objects:
                 raise HTTPException(status_code=400, detail="No valid frames could be processed")
@@ -389,32 +1034,31 @@ async def export_pdf(request: ExportPDFRequest):
             if not script_content:
                 raise HTTPException(status_code=400, detail="Either frames or script_content must be provided")
             
-            script_processor = get_script_processor()
-            scenes = script_processor.parse_script_content(script_content)
+            scenes = await asyncio.to_thread(_parse_script_cached, script_content)
             translator = get_llm_translator(provider=llm_provider or "bria")
             generator = get_fibo_generator()
             
             # Generate storyboard with custom parameters if provided
-            if custom_params:
-                storyboard = generator.create_storyboard(scenes, translator, custom_params=custom_params)
-            else:
-                storyboard = generator.create_storyboard(scenes, translator)
+            storyboard = await asyncio.to_thread(
+                generator.create_storyboard, scenes, translator,
+                custom_params=custom_params
+            )
         
-        # Export PDF
-        pdf_path = get_output_dir() / "storyboard.pdf"
-        result = storyboard.export_pdf(str(pdf_path))
+        # Export PDF in memory - no shared file on disk to clobber or re-read
+        pdf_buffer = BytesIO()
+        await asyncio.to_thread(storyboard.export_pdf, pdf_buffer)
         
         # Check if PDF was created successfully
-        if not pdf_path.exists():
+        if not pdf_buffer.getbuffer().nbytes:
             raise HTTPException(
                 status_code=500, 
                 detail="PDF export failed. reportlab may not be installed. Install with: pip install reportlab"
             )
         
-        return FileResponse(
-            path=str(pdf_path),
+        return Response(
+            content=pdf_buffer.getvalue(),
             media_type="application/pdf",
-            filename="storyboard.pdf"
+            headers={"Content-Disposition": 'attachment; filename="storyboard.pdf"'}
         )
     except HTTPException:
         raise
@@ -439,33 +1083,32 @@ async def export_animatic(request: GenerateRequest, duration: float = 3.0):
     """
     try:
         # Generate storyboard
-        script_processor = get_script_processor()
-        scenes = script_processor.parse_script_content(request.script_content)
+        scenes = await asyncio.to_thread(_parse_script_cached, request.script_content)
         translator = get_llm_translator(provider=request.llm_provider)
         generator = get_fibo_generator()
         
         # Generate storyboard with custom parameters if provided
-        if request.custom_params:
-            storyboard = generator.create_storyboard(scenes, translator, custom_params=request.custom_params)
-        else:
-            storyboard = generator.create_storyboard(scenes, translator)
-        
-        # Export animatic
-        video_path = get_output_dir() / "animatic.mp4"
-        storyboard.export_animatic(str(video_path), duration_per_frame=duration)
+        storyboard = await asyncio.to_thread(
+            generator.create_storyboard, scenes, translator,
+            custom_params=request.custom_params
+        )
         
-        # Check if video was created successfully
-        if not video_path.exists():
-            raise HTTPException(
-                status_code=500,
-                detail="Animatic export failed. Check if opencv-python and imageio-ffmpeg are installed."
-            )
+        # Export animatic to a per-request file (the video encoders need a real path)
+        video_path = _temp_output_path(".mp4")
+        try:
+            await asyncio.to_thread(storyboard.export_animatic, video_path, duration_per_frame=duration)
+            
+            # Check if video was created successfully
+            if not os.path.getsize(video_path):
+                raise HTTPException(
+                    status_code=500,
+                    detail="Animatic export failed. Check if opencv-python and imageio-ffmpeg are installed."
+                )
+        except BaseException:
+            _remove_file(video_path)
+            raise
         
-        return FileResponse(
-            path=str(video_path),
-            media_type="video/mp4",
-            filename="animatic.mp4"
-        )
+        return _video_response(video_path, "animatic.mp4")
     except HTTPException:
         raise
     except Exception as e:
@@ -494,38 +1137,49 @@ async def regenerate_scene(request: RegenerateSceneRequest):
         generator = get_fibo_generator()
         
         # Generate frame with new parameters
-        frame = generator.generate_frame(
+        frame = await asyncio.to_thread(
+            generator.generate_frame,
             request.scene_description,
             request.params,
             request.scene_number
         )
         
         # Convert to response format
-        return FrameResponse(
-            scene_number=frame.scene_number,
-            image=frame.to_dict()["image"],
-            params=frame.params
-        )
+        frame_responses = await asyncio.to_thread(_frame_responses, [frame])
+        return frame_responses[0]
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Transport encodings for edited frames: PIL format, MIME type, save options
+# (WebP/JPEG are several times smaller and faster to encode than PNG for previews)
+EDIT_FRAME_FORMATS = {
+    "png": ("PNG", "image/png", {}),
+    "webp": ("WEBP", "image/webp", {"quality": 88, "method": 4}),
+    "jpeg": ("JPEG", "image/jpeg", {"quality": 85}),
+}
+
+
 @app.post("/api/edit-frame")
-async def edit_frame(request: EditFrameRequest, storyboard_data: Dict):
+async def edit_frame(request: EditFrameRequest, storyboard_data: Dict,
+                     image_format: str = Query("png", alias="format")):
     """
     Edit a single storyboard frame using BRIA AI editing features
     
     Args:
         request: Edit request with frame index and edit type
         storyboard_data: Storyboard data from previous generation
+        image_format: Encoding of the returned image (png, webp or jpeg)
         
     Returns:
         Edited frame
     """
+    if image_format not in EDIT_FRAME_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unknown image format: {image_format}")
+    pil_format, media_type, save_options = EDIT_FRAME_FORMATS[image_format]
+    
     try:
-        from core.bria_client import BRIAAPIClient
-        
-        bria_client = BRIAAPIClient(api_token=os.getenv("BRIA_API_TOKEN"))
+        bria_client = _require_bria_client()
         
         # Get frame from storyboard data
         frames = storyboard_data.get("frames", [])
@@ -533,42 +1187,43 @@ async def edit_frame(request: EditFrameRequest, storyboard_data: Dict):
             raise HTTPException(status_code=400, detail="Invalid frame index")
         
         frame = frames[request.frame_index]
-        image_url = frame.get("image")  # base64 data URI
-        
-        # Extract base64 from data URI
-        if image_url.startswith("data:image"):
-            image_base64 = image_url.split(",")[1]
-            image_url = f"data:image/png;base64,{image_base64}"
+        # base64 data URI, sent as posted - its header names the real format
+        # (frames come back as PNG, WebP or JPEG depending on the format asked
+        # for). Frames of a loaded storyboard are frame URLs on this server,
+        # which BRIA cannot fetch, so those are sent as data URLs.
+        image_url = frame.get("image")
+        if not (isinstance(image_url, str) and image_url.startswith(("https://", "http://"))):
+            image_url = await asyncio.to_thread(_posted_data_url, image_url)
         
         # Perform edit based on type
         if request.edit_type == "reimagine":
-            edited_image = bria_client.reimagine_image(
+            edit = lambda: bria_client.reimagine_image(
                 image_url=image_url,
                 prompt=request.prompt or "Enhance the scene",
                 sync=True
             )
         elif request.edit_type == "genfill":
-            edited_image = bria_client.generative_fill(
+            edit = lambda: bria_client.generative_fill(
                 image_url=image_url,
                 prompt=request.prompt or "Add elements",
                 mask_url=request.mask_url,
                 sync=True
             )
         elif request.edit_type == "eraser":
-            edited_image = bria_client.erase_object(
+            edit = lambda: bria_client.erase_object(
                 image_url=image_url,
                 mask_url=request.mask_url,
                 prompt=request.prompt,
                 sync=True
             )
         elif request.edit_type == "background":
-            edited_image = bria_client.replace_background(
+            edit = lambda: bria_client.replace_background(
                 image_url=image_url,
                 background_prompt=request.prompt or "New background",
                 sync=True
             )
         elif request.edit_type == "upscale":
-            edited_image = bria_client.upscale_image(
+            edit = lambda: bria_client.upscale_image(
                 image_url=image_url,
                 scale_factor=request.scale_factor or 2,
                 sync=True
@@ -576,16 +1231,24 @@ async def edit_frame(request: EditFrameRequest, storyboard_data: Dict):
         else:
             raise HTTPException(status_code=400, detail=f"Unknown edit type: {request.edit_type}")
         
-        # Convert to base64 for response
-        img_buffer = BytesIO()
-        edited_image.save(img_buffer, format='PNG')
-        img_base64 = base64.b64encode(img_buffer.getvalue()).decode('utf-8')
+        def edit_and_encode():
+            edited_image = edit()
+            if pil_format == "JPEG" and edited_image.mode != "RGB":
+                edited_image = edited_image.convert("RGB")
+            # Convert to base64 for response
+            img_buffer = BytesIO()
+            edited_image.save(img_buffer, format=pil_format, **save_options)
+            return base64.b64encode(img_buffer.getvalue()).decode('utf-8')
+        
+        img_base64 = await asyncio.to_thread(edit_and_encode)
         
         return FrameResponse(
             scene_number=frame.get("scene_number", request.frame_index + 1),
-            image=f"data:image/png;base64,{img_base64}",
+            image=f"data:{media_type};base64,{img_base64}",
             params=frame.get("params", {})
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -603,27 +1266,23 @@ async def generate_ai_animatic(request: GenerateRequest, duration: float = 3.0):
         Video file download
     """
     try:
-        from core.bria_client import BRIAAPIClient
-        
         # Generate storyboard first
-        script_processor = get_script_processor()
-        scenes = script_processor.parse_script_content(request.script_content)
+        scenes = await asyncio.to_thread(_parse_script_cached, request.script_content)
         translator = get_llm_translator(provider=request.llm_provider)
         generator = get_fibo_generator()
-        storyboard = generator.create_storyboard(scenes, translator)
+        storyboard = await asyncio.to_thread(generator.create_storyboard, scenes, translator)
         
-        # Initialize BRIA client
-        bria_client = BRIAAPIClient(api_token=os.getenv("BRIA_API_TOKEN"))
+        bria_client = _require_bria_client()
         
         # Generate AI animatic
-        video_path = get_output_dir() / "ai_animatic.mp4"
-        storyboard.generate_ai_animatic(bria_client, str(video_path), duration)
+        video_path = _temp_output_path(".mp4")
+        try:
+            await asyncio.to_thread(storyboard.generate_ai_animatic, bria_client, video_path, duration)
+        except BaseException:
+            _remove_file(video_path)
+            raise
         
-        return FileResponse(
-            path=str(video_path),
-            media_type="video/mp4",
-            filename="ai_animatic.mp4"
-        )
+        return _video_response(video_path, "ai_animatic.mp4")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -640,46 +1299,39 @@ async def enhance_storyboard(request: EnhanceStoryboardRequest):
         Enhanced storyboard
     """
     try:
-        from core.bria_client import BRIAAPIClient
         from core.storyboard import Storyboard
         from core.fibo_engine import Frame
         
-        bria_client = BRIAAPIClient(api_token=os.getenv("BRIA_API_TOKEN"))
+        bria_client = _require_bria_client()
         
         # Reconstruct storyboard from data
-        frames = []
-        for frame_data in request.storyboard_data.get("frames", []):
-            # Decode base64 image
-            image_data = frame_data["image"].split(",")[1]
-            image_bytes = base64.b64decode(image_data)
-            image = Image.open(BytesIO(image_bytes))
-            
-            frame = Frame(
-                scene_number=frame_data["scene_number"],
-                image=image,
-                params=frame_data["params"]
-            )
-            frames.append(frame)
+        def decode_frames():
+            frames = []
+            for frame_data in request.storyboard_data.get("frames", []):
+                # Decode base64 image, keeping the data URL to upload as-is
+                # (a loaded storyboard's frame URLs are read from their files)
+                frame = Frame.from_data_url(
+                    frame_data["scene_number"],
+                    _posted_data_url(frame_data["image"]),
+                    frame_data["params"]
+                )
+                frames.append(frame)
+            return frames
         
-        storyboard = Storyboard(frames)
+        storyboard = Storyboard(await asyncio.to_thread(decode_frames))
         
         # Enhance frames
-        storyboard.enhance_frames(bria_client, request.upscale_factor)
+        await asyncio.to_thread(storyboard.enhance_frames, bria_client, request.upscale_factor)
         
         # Convert to response format
-        frame_responses = [
-            FrameResponse(
-                scene_number=frame.scene_number,
-                image=frame.to_dict()["image"],
-                params=frame.params
-            )
-            for frame in storyboard.frames
-        ]
+        frame_responses = await asyncio.to_thread(_frame_responses, storyboard.frames)
         
         return StoryboardResponse(
             frames=frame_responses,
             frame_count=len(frame_responses)
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -705,15 +1357,6 @@ async def save_scene(request: SaveSceneRequest):
         Success message with saved scene info
     """
     try:
-        # Create saved scenes directory
-        saved_dir = get_output_dir() / "saved_scenes"
-        try:
-            saved_dir.mkdir(parents=True, exist_ok=True)
-        except (OSError, PermissionError):
-            # Fallback to /tmp if OUTPUT_DIR is read-only
-            saved_dir = Path("/tmp/outputs/saved_scenes")
-            saved_dir.mkdir(parents=True, exist_ok=True)
-        
         scene_id = str(uuid.uuid4())
         timestamp = datetime.now().isoformat()
         
@@ -723,21 +1366,22 @@ async def save_scene(request: SaveSceneRequest):
             "params": request.params,
             "description": request.description or request.params.get("scene_description", ""),
             "name": request.name or f"Scene {request.scene_number}",
-            "timestamp": request.timestamp or timestamp,
-            "image": request.image
+            "timestamp": request.timestamp or timestamp
         }
         
-        # Save to file
-        scene_file = saved_dir / f"{scene_id}.json"
-        with open(scene_file, 'w') as f:
-            json.dump(scene_data, f, indent=2)
+        # Save to the library - the image is decoded once and stored as a file
+        # in the format it was posted in (PNG, JPEG or WebP)
+        library = await asyncio.to_thread(get_scene_library)
+        mime_type, image_bytes = await asyncio.to_thread(_posted_image, request.image)
+        await asyncio.to_thread(library.save_scene, scene_data, image_bytes, _IMAGE_EXTENSIONS[mime_type])
         
-        return {
+        return OrjsonResponse({
             "status": "success",
             "message": f"Scene {request.scene_number} saved successfully",
-            "scene_id": scene_id,
-            "file": str(scene_file.name)
-        }
+            "scene_id": scene_id
+        })
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -751,38 +1395,27 @@ async def list_saved_scenes():
         List of saved scenes
     """
     try:
-        saved_dir = get_output_dir() / "saved_scenes"
-        saved_dir.mkdir(exist_ok=True)
+        library = await asyncio.to_thread(get_scene_library)
         
+        # Single indexed query, already sorted by timestamp (newest first)
         scenes = []
-        
-        # Read all JSON files in saved_scenes directory
-        for file_path in saved_dir.glob("*.json"):
-            try:
-                with open(file_path, 'r') as f:
-                    scene_data = json.load(f)
-                    scene_name = scene_data.get("name")
-                    # Ensure name is a string or None (not empty string)
-                    if scene_name and isinstance(scene_name, str) and scene_name.strip():
-                        scene_name = scene_name.strip()
-                    else:
-                        scene_name = None
-                    
-                    scenes.append({
-                        "id": scene_data.get("id", file_path.stem),
-                        "scene_number": scene_data.get("scene_number", 0),
-                        "name": scene_name,
-                        "description": scene_data.get("description", ""),
-                        "params": scene_data.get("params", {}),
-                        "timestamp": scene_data.get("timestamp"),
-                        "thumbnail": scene_data.get("image")
-                    })
-            except Exception as e:
-                print(f"Error reading {file_path}: {e}")
-                continue
-        
-        # Sort by timestamp (newest first)
-        scenes.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
+        for scene_data in await asyncio.to_thread(library.list_scenes):
+            scene_name = scene_data.get("name")
+            # Ensure name is a string or None (not empty string)
+            if scene_name and isinstance(scene_name, str) and scene_name.strip():
+                scene_name = scene_name.strip()
+            else:
+                scene_name = None
+            
+            scenes.append({
+                "id": scene_data["id"],
+                "scene_number": scene_data.get("scene_number", 0),
+                "name": scene_name,
+                "description": scene_data.get("description", ""),
+                "params": scene_data.get("params", {}),
+                "timestamp": scene_data.get("timestamp"),
+                "thumbnail": _saved_scene_image_url(scene_data["id"])
+            })
         
         return {
             "status": "success",
@@ -805,14 +1438,13 @@ async def get_saved_scene(scene_id: str):
         Scene data
     """
     try:
-        saved_dir = get_output_dir() / "saved_scenes"
-        scene_file = saved_dir / f"{scene_id}.json"
+        library = await asyncio.to_thread(get_scene_library)
+        scene_data = await asyncio.to_thread(library.get_scene, scene_id)
         
-        if not scene_file.exists():
+        if scene_data is None:
             raise HTTPException(status_code=404, detail="Scene not found")
         
-        with open(scene_file, 'r') as f:
-            scene_data = json.load(f)
+        scene_data["image"] = _saved_scene_image_url(scene_id)
         
         return {
             "status": "success",
@@ -824,6 +1456,26 @@ async def get_saved_scene(scene_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/saved-scene/{scene_id}/image")
+async def get_saved_scene_image(scene_id: str):
+    """
+    Get the image of a saved scene
+    
+    Args:
+        scene_id: ID of the scene
+        
+    Returns:
+        PNG, JPEG or WebP image
+    """
+    library = await asyncio.to_thread(get_scene_library)
+    image_path = await asyncio.to_thread(library.image_path, scene_id)
+    
+    if not image_path.is_file():
+        raise HTTPException(status_code=404, detail="Scene image not found")
+    
+    return FileResponse(path=str(image_path), media_type=f"image/{image_path.suffix[1:]}")
+
+
 @app.delete("/api/saved-scene/{scene_id}")
 async def delete_saved_scene(scene_id: str):
     """
@@ -836,18 +1488,15 @@ async def delete_saved_scene(scene_id: str):
         Success message
     """
     try:
-        saved_dir = get_output_dir() / "saved_scenes"
-        scene_file = saved_dir / f"{scene_id}.json"
+        library = await asyncio.to_thread(get_scene_library)
         
-        if not scene_file.exists():
+        if not await asyncio.to_thread(library.delete_scene, scene_id):
             raise HTTPException(status_code=404, detail="Scene not found")
         
-        scene_file.unlink()
-        
-        return {
+        return OrjsonResponse({
             "status": "success",
             "message": "Scene deleted successfully"
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -872,136 +1521,127 @@ async def save_storyboard(request: SaveStoryboardRequest):
         Success message with saved storyboard info
     """
     try:
-        # Create saved storyboards directory
-        saved_dir = get_output_dir() / "saved_storyboards"
-        try:
-            saved_dir.mkdir(parents=True, exist_ok=True)
-        except (OSError, PermissionError):
-            # Fallback to /tmp if OUTPUT_DIR is read-only
-            saved_dir = Path("/tmp/outputs/saved_storyboards")
-            saved_dir.mkdir(parents=True, exist_ok=True)
-        
+        saved_dir = get_saved_storyboards_dir()
         
         storyboard_id = str(uuid.uuid4())
         timestamp = datetime.now().isoformat()
         
+        # Frames are stored normalized, since get_saved_storyboard sends the
+        # file as it is; their images are written out as files and referenced by URL
+        frames = _normalize_storyboard({"frames": request.frames}, storyboard_id)["frames"]
+        frames = await asyncio.to_thread(_externalize_frame_images, saved_dir, storyboard_id, frames)
+        
         storyboard_data = {
             "id": storyboard_id,
             "name": request.name or f"Storyboard {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-            "frames": request.frames,  # Already dictionaries
-            "frame_count": len(request.frames),
+            "frames": frames,
+            "frame_count": len(frames),
             "script_content": request.script_content,
             "created_at": timestamp,
             "updated_at": timestamp,
-            "thumbnail": request.frames[0].get("image") if request.frames else None
+            "thumbnail": (frames[0]["image"] or None) if frames else None
         }
         
         # Save to file
         storyboard_file = saved_dir / f"{storyboard_id}.json"
-        with open(storyboard_file, 'w') as f:
-            json.dump(storyboard_data, f, indent=2)
+        await asyncio.to_thread(_write_json, storyboard_file, storyboard_data)
+        await asyncio.to_thread(
+            _update_storyboard_index, saved_dir,
+            add=_storyboard_summary(storyboard_data, storyboard_id)
+        )
         
-        return {
+        return OrjsonResponse({
             "status": "success",
             "message": "Storyboard saved successfully",
             "storyboard_id": storyboard_id,
             "file": str(storyboard_file.name)
-        }
+        })
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/saved-storyboards")
-async def list_saved_storyboards():
+async def list_saved_storyboards(request: Request):
     """
     List all saved storyboards
     
+    Args:
+        request: Incoming request (Accept: application/msgpack selects MessagePack)
+    
     Returns:
         List of saved storyboards
     """
     try:
-        saved_dir = get_output_dir() / "saved_storyboards"
-        saved_dir.mkdir(exist_ok=True)
-        
-        from pathlib import Path
-        
-        storyboards = []
-        
-        # Read all JSON files in saved_storyboards directory
-        for file_path in saved_dir.glob("*.json"):
-            try:
-                with open(file_path, 'r') as f:
-                    storyboard_data = json.load(f)
-                    # Only include essential info for list view
-                    storyboards.append({
-                        "id": storyboard_data.get("id", file_path.stem),
-                        "name": storyboard_data.get("name", "Unnamed Storyboard"),
-                        "frame_count": storyboard_data.get("frame_count", 0),
-                        "created_at": storyboard_data.get("created_at"),
-                        "updated_at": storyboard_data.get("updated_at"),
-                        "thumbnail": storyboard_data.get("thumbnail")
-                    })
-            except Exception as e:
-                print(f"Error reading {file_path}: {e}")
-                continue
-        
-        # Sort by created_at (newest first)
-        storyboards.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-        
-        return {
-            "status": "success",
-            "storyboards": storyboards,
-            "count": len(storyboards)
-        }
+        saved_dir = get_saved_storyboards_dir()
+        
+        # The index already holds the list response, so it is streamed from disk
+        index_path = await asyncio.to_thread(_storyboard_index_path, saved_dir)
+        if _wants_msgpack(request):
+            return await asyncio.to_thread(_msgpack_response, index_path)
+        stat_result = await asyncio.to_thread(os.stat, index_path)
+        return _json_file_response(request, index_path, stat_result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/saved-storyboard/{storyboard_id}")
-async def get_saved_storyboard(storyboard_id: str):
+async def get_saved_storyboard(storyboard_id: str, request: Request):
     """
     Get a specific saved storyboard
     
     Args:
         storyboard_id: ID of the storyboard
+        request: Incoming request (Accept: application/msgpack selects MessagePack)
         
     Returns:
         Storyboard data
     """
+    _check_storyboard_id(storyboard_id)
+    
     try:
-        saved_dir = get_output_dir() / "saved_storyboards"
+        saved_dir = get_saved_storyboards_dir()
         storyboard_file = saved_dir / f"{storyboard_id}.json"
         
-        if not storyboard_file.exists():
+        try:
+            stat_result = await asyncio.to_thread(os.stat, storyboard_file)
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail="Storyboard not found")
         
-        with open(storyboard_file, 'r') as f:
-            storyboard_data = json.load(f)
-        
-        # Convert to StoryboardResponse format with name and id
-        response_data = StoryboardResponse(
-            frames=[
-                FrameResponse(
-                    scene_number=frame.get("scene_number", i + 1),
-                    image=frame.get("image", ""),
-                    params=frame.get("params", {})
-                )
-                for i, frame in enumerate(storyboard_data.get("frames", []))
-            ],
-            frame_count=storyboard_data.get("frame_count", 0),
-            script_content=storyboard_data.get("script_content")
-        )
-        # Add name and id to response
-        response_dict = response_data.dict()
-        response_dict["name"] = storyboard_data.get("name", "Unnamed Storyboard")
-        response_dict["id"] = storyboard_data.get("id", storyboard_id)
-        return response_dict
+        # save_storyboard writes the file in the response shape already (normalized
+        # frames, frame_count, script_content, name, id plus its timestamps) and
+        # older files are migrated when the directory is first used, so it is
+        # sent straight from disk without parsing or re-serializing it
+        if _wants_msgpack(request):
+            return await asyncio.to_thread(_msgpack_response, storyboard_file)
+        return _json_file_response(request, storyboard_file, stat_result)
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/saved-storyboard/{storyboard_id}/frames/{filename}")
+async def get_saved_storyboard_frame(storyboard_id: str, filename: str):
+    """
+    Get a frame image of a saved storyboard
+    
+    Args:
+        storyboard_id: ID of the storyboard
+        filename: Frame image file name (frame_{n}.{ext})
+        
+    Returns:
+        Frame image
+    """
+    frame_path = _saved_frame_path(_saved_frame_url(storyboard_id, filename))
+    
+    if frame_path is None or not frame_path.is_file():
+        raise HTTPException(status_code=404, detail="Frame image not found")
+    
+    return FileResponse(path=str(frame_path))
+
+
 @app.delete("/api/saved-storyboard/{storyboard_id}")
 async def delete_saved_storyboard(storyboard_id: str):
     """
@@ -1013,25 +1653,66 @@ async def delete_saved_storyboard(storyboard_id: str):
     Returns:
         Success message
     """
+    _check_storyboard_id(storyboard_id)
+    
     try:
-        saved_dir = get_output_dir() / "saved_storyboards"
-        storyboard_file = saved_dir / f"{storyboard_id}.json"
+        saved_dir = get_saved_storyboards_dir()
         
-        if not storyboard_file.exists():
+        if not await asyncio.to_thread(_delete_storyboard_files, saved_dir, storyboard_id):
             raise HTTPException(status_code=404, detail="Storyboard not found")
         
-        storyboard_file.unlink()
+        await asyncio.to_thread(_update_storyboard_index, saved_dir, remove_ids=[storyboard_id])
         
-        return {
+        return OrjsonResponse({
             "status": "success",
             "message": "Storyboard deleted successfully"
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+class DeleteStoryboardsRequest(BaseModel):
+    ids: List[str]
+
+
+@app.post("/api/saved-storyboards/delete")
+async def delete_saved_storyboards(request: DeleteStoryboardsRequest):
+    """
+    Delete several saved storyboards at once
+    
+    Args:
+        request: IDs of the storyboards to delete
+        
+    Returns:
+        Success message with the deleted IDs and any that were not found
+    """
+    for storyboard_id in request.ids:
+        _check_storyboard_id(storyboard_id)
+    
+    try:
+        saved_dir = get_saved_storyboards_dir()
+        
+        def delete_all():
+            deleted = [i for i in dict.fromkeys(request.ids) if _delete_storyboard_files(saved_dir, i)]
+            # The index is rewritten once for the whole batch
+            if deleted:
+                _update_storyboard_index(saved_dir, remove_ids=deleted)
+            return deleted
+        
+        deleted = await asyncio.to_thread(delete_all)
+        
+        return OrjsonResponse({
+            "status": "success",
+            "message": f"Deleted {len(deleted)} storyboard(s)",
+            "deleted": deleted,
+            "not_found": [i for i in request.ids if i not in deleted]
+        })
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -5,16 +5,64 @@ Documentation: https://docs.bria.ai
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+import socket
 import time
+import random
 import os
-from typing import Dict, Optional
+import hashlib
+import threading
+from concurrent.futures import Future
+import json
+import orjson
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from PIL import Image
 from io import BytesIO
-import base64
+try:
+    # pybase64 (optional) decodes BRIA image payloads faster
+    import pybase64 as base64
+except ImportError:
+    import base64
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Prompt fragment tables for build_fibo_prompt, built once at import
+_FOV_BOUNDS = (30, 50)  # FOV below 30 is a close-up, below 50 a medium shot
+_FOV_SHOTS = ("close-up shot", "medium shot", "wide shot")
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+
+
+def _batch_size_from_env() -> int:
+    """Read FIBO_BATCH, falling back to 5 when it is unset or not a positive integer"""
+    value = os.getenv("FIBO_BATCH", "5")
+    try:
+        batch_size = int(value)
+    except ValueError:
+        batch_size = 0
+    if batch_size < 1:
+        print(f"Warning: Invalid FIBO_BATCH={value!r}, using 5")
+        return 5
+    return batch_size
+
+
+# Max concurrent BRIA requests for one storyboard (generation, upscaling, videos)
+FIBO_BATCH = _batch_size_from_env()
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose sockets use TCP keepalive as well as urllib3's TCP_NODELAY"""
+    
+    SOCKET_OPTIONS = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
 
 class BRIAAPIClient:
     """Client for BRIA AI API"""
@@ -48,6 +96,183 @@ class BRIAAPIClient:
         }
         # Also support x-api-key format if needed
         # self.headers["x-api-key"] = self.api_token
+        
+        # One pooled session for the client's lifetime, so status polls, edits
+        # and downloads reuse connections instead of a TCP + TLS handshake each.
+        # Headers stay per-request - the API token must not be sent along to
+        # the (third-party) URLs images are downloaded from.
+        self.session = self._create_session()
+        
+        # Opt-in on-disk cache of generated images for iterating on the same
+        # prompts during development. Off by default - regenerating a scene is
+        # expected to give a fresh variation, not the previous image.
+        cache_dir = os.getenv("BRIA_CACHE_DIR")
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_ttl = int(os.getenv("BRIA_CACHE_TTL", "86400"))
+        
+        # Identical generate/upscale requests currently running, by request key
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+    
+    def _create_session(self) -> requests.Session:
+        """
+        Create an HTTP session with connection pooling and transient-error retries
+        
+        Status polls and downloads are idempotent GETs and retry on any
+        transient failure. Submissions are POSTs that would start a second
+        (billed) generation if replayed after BRIA accepted them, so they get
+        their own adapter that only retries when the request was turned away:
+        connection failures, 429 and 503. Both honor Retry-After.
+        """
+        get_retry = Retry(
+            total=5,
+            connect=3,
+            read=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=True,
+            raise_on_status=False  # Hand the last response to raise_for_status as before
+        )
+        post_retry = Retry(
+            total=2,
+            connect=2,
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=(429, 503),
+            allowed_methods=frozenset({"POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        get_adapter = _KeepAliveAdapter(pool_connections=4, pool_maxsize=32, pool_block=False, max_retries=get_retry)
+        post_adapter = _KeepAliveAdapter(pool_connections=4, pool_maxsize=32, pool_block=False, max_retries=post_retry)
+        
+        session = requests.Session()
+        session.mount("https://", get_adapter)
+        session.mount("http://", get_adapter)
+        # The most specific prefix wins, so the submit endpoints use the POST policy
+        for prefix in (
+            self.GENERATE_ENDPOINT,
+            f"{self.BASE_URL}/edit",
+            f"{self.BASE_URL}/upscale",
+            f"{self.BASE_URL}/video/"
+        ):
+            session.mount(prefix, post_adapter)
+        return session
+    
+    def _post_json(self, url: str, payload: Dict, timeout: float = 30) -> Dict:
+        """
+        POST a JSON payload to a BRIA endpoint and return the decoded response
+        
+        The one place submissions go through, so timeouts, serialization and
+        error handling change in one spot. The payload is serialized with
+        orjson - edit and upscale payloads carry multi-MB base64 images.
+        
+        Raises:
+            requests.exceptions.RequestException: On connection or HTTP errors
+        """
+        response = self.session.post(url, data=orjson.dumps(payload), headers=self.headers, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+    
+    def warm_up(self):
+        """
+        Open connections to the BRIA API in a background thread
+        
+        Resolves DNS and completes the TCP + TLS handshake for both pools
+        (status polls and submissions), so the first user request doesn't pay
+        for them. Failures are ignored - the request will simply connect itself.
+        """
+        def connect(url):
+            try:
+                self.session.head(url, timeout=5).close()
+            except requests.exceptions.RequestException:
+                pass
+        
+        def warm():
+            for url in (f"{self.BASE_URL}/status", self.GENERATE_ENDPOINT):
+                connect(url)
+        
+        threading.Thread(target=warm, name="bria-warm-up", daemon=True).start()
+    
+    def close(self):
+        """Close the pooled HTTP connections"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    @staticmethod
+    def _request_key(endpoint: str, payload: Dict) -> str:
+        """Stable key for a request payload"""
+        blob = json.dumps({"endpoint": endpoint, **payload}, sort_keys=True, default=str)
+        return hashlib.blake2b(blob.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _single_flight(self, key: str, call: Callable[[], Any]) -> Any:
+        """
+        Run call, unless an identical request is already in flight
+        
+        A request that arrives while the same one is running (a double-fired
+        UI action, say) waits for and shares that result instead of paying
+        for a second API call.
+        
+        Args:
+            key: Request key (see _request_key)
+            call: Function making the request
+            
+        Returns:
+            Result of call (or of the in-flight identical request)
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = self._inflight[key] = Future()
+        
+        if not is_leader:
+            return future.result()
+        
+        try:
+            result = call()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    def _cached_image(self, key: str) -> Optional[Image.Image]:
+        """Load a cached image if caching is on and it is present and not expired"""
+        if self.cache_dir is None:
+            return None
+        path = self.cache_dir / f"{key}.png"
+        try:
+            if time.time() - path.stat().st_mtime > self.cache_ttl:
+                return None
+            image = Image.open(path)
+            image.load()
+            return image
+        except (OSError, ValueError):
+            return None
+    
+    def _store_image(self, key: str, image: Image.Image):
+        """Store an image if caching is on (written atomically; failures are only logged)"""
+        if self.cache_dir is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self.cache_dir / f"{key}.png"
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            image.save(tmp_path, format="PNG")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️  Could not cache BRIA image: {e}")
     
     def generate_image(self, prompt: str, 
                       negative_prompt: Optional[str] = None,
@@ -95,11 +320,7 @@ class BRIAAPIClient:
             payload["negative_prompt"] = negative_prompt
         
         try:
-            response = requests.post(url, json=payload, headers=self.headers, timeout=30)
-            response.raise_for_status()
-            result = response.json()
-            
-            return result
+            return self._post_json(url, payload)
         except requests.exceptions.HTTPError as e:
             error_detail = ""
             if hasattr(e, 'response') and e.response is not None:
@@ -140,34 +361,50 @@ class BRIAAPIClient:
         Returns:
             Status dictionary with status, result, etc.
         """
+        return self._fetch_status(request_id)[0]
+    
+    def _fetch_status(self, request_id: str) -> Tuple[Dict, Optional[float]]:
+        """Check status of an async request, also returning any Retry-After delay in seconds"""
         # Status endpoint might be different - try both patterns
         url = f"{self.BASE_URL}/status/{request_id}"
         
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, headers=self.headers, timeout=10)
             response.raise_for_status()
-            return response.json()
         except requests.exceptions.RequestException as e:
             raise Exception(f"BRIA API status check failed: {str(e)}")
+        
+        try:
+            retry_after = float(response.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            retry_after = None  # Absent, or an HTTP date rather than seconds
+        return response.json(), retry_after
     
     def wait_for_completion(self, request_id: str, 
                            max_wait: int = 300,
-                           poll_interval: int = 2) -> Dict:
+                           poll_interval: float = 0.5,
+                           max_poll_interval: float = 8.0) -> Dict:
         """
         Wait for async request to complete
         
+        Polls with exponential backoff (plus jitter), so short jobs are picked
+        up quickly and long ones don't hammer the API. A Retry-After header on
+        the status response takes precedence over the backoff.
+        
         Args:
             request_id: Request ID
             max_wait: Maximum wait time in seconds (default: 300)
-            poll_interval: Polling interval in seconds (default: 2)
+            poll_interval: Initial polling interval in seconds (default: 0.5)
+            max_poll_interval: Longest polling interval in seconds (default: 8)
             
         Returns:
             Final status dictionary with result
         """
-        start_time = time.time()
+        start_time = time.monotonic()
+        interval = poll_interval
         
-        while time.time() - start_time < max_wait:
-            status = self.check_status(request_id)
+        while True:
+            status, retry_after = self._fetch_status(request_id)
             
             if status.get("status") == "COMPLETED":
                 return status
@@ -178,7 +415,11 @@ class BRIAAPIClient:
                 raise Exception(f"BRIA API unknown error. Request ID: {request_id}")
             
             # Status is IN_PROGRESS, continue polling
-            time.sleep(poll_interval)
+            remaining = max_wait - (time.monotonic() - start_time)
+            if remaining <= 0:
+                break
+            time.sleep(min(retry_after if retry_after is not None else interval, remaining))
+            interval = min(interval * 1.6, max_poll_interval) + random.uniform(0, 0.25)
         
         raise TimeoutError(f"Request {request_id} did not complete within {max_wait} seconds")
     
@@ -201,6 +442,31 @@ class BRIAAPIClient:
         Returns:
             PIL Image object
         """
+        key = self._request_key("generate", {
+            "prompt": prompt,
+            "negative_prompt": negative_prompt,
+            "width": width,
+            "height": height,
+            "model_id": model_id,
+            **kwargs
+        })
+        
+        def generate():
+            image = self._cached_image(key)
+            if image is None:
+                image = self._generate_image_sync(prompt, negative_prompt, width, height, model_id, **kwargs)
+                self._store_image(key, image)
+            return image
+        
+        return self._single_flight(key, generate)
+    
+    def _generate_image_sync(self, prompt: str,
+                            negative_prompt: Optional[str],
+                            width: int,
+                            height: int,
+                            model_id: Optional[str],
+                            **kwargs) -> Image.Image:
+        """Generate an image (sync request with async fallback), bypassing the cache"""
         # Try sync first
         try:
             response = self.generate_image(
@@ -213,17 +479,9 @@ class BRIAAPIClient:
                 **kwargs
             )
             
-            if "image_url" in response:
-                return self._download_image(response["image_url"])
-            elif "image" in response:
-                # Handle base64 encoded image directly
-                return self._decode_base64_image(response["image"])
-            elif "data" in response:
-                # Handle base64 data URI
-                image_data = response["data"]
-                if isinstance(image_data, str) and image_data.startswith("data:image"):
-                    return self._decode_base64_image(image_data.split(",")[1])
-                return self._decode_base64_image(image_data)
+            image = self._image_from_sync_response(response)
+            if image is not None:
+                return image
         except Exception as e:
             print(f"⚠️  Sync generation failed: {e}, falling back to async")
             pass
@@ -239,13 +497,50 @@ class BRIAAPIClient:
             **kwargs
         )
         
+        return self._resolve_image_response(response, sync=False)
+    
+    def _image_from_sync_response(self, response: Dict) -> Optional[Image.Image]:
+        """
+        Get the image from a sync API response
+        
+        Args:
+            response: API response dictionary
+            
+        Returns:
+            PIL Image, or None if the response carries no image
+        """
+        if "image_url" in response:
+            return self._download_image(response["image_url"])
+        elif "image" in response:
+            # Handle base64 encoded image directly
+            return self._decode_base64_image(response["image"])
+        elif "data" in response:
+            # Handle base64 data URI (the header is stripped when decoding)
+            return self._decode_base64_image(response["data"])
+        return None
+    
+    def _resolve_image_response(self, response: Dict, sync: bool) -> Image.Image:
+        """
+        Get the resulting image of an image request, polling for it if needed
+        
+        Args:
+            response: Response dictionary of the submitted request
+            sync: Whether the request was made synchronously
+            
+        Returns:
+            Result PIL Image
+        """
+        if sync:
+            image = self._image_from_sync_response(response)
+            if image is not None:
+                return image
+        
+        # Async handling
         request_id = response.get("request_id")
         if not request_id:
             raise Exception("No request_id in response")
         
-        # Wait for completion
         final_status = self.wait_for_completion(request_id)
-        
         result = final_status.get("result", {})
         image_url = result.get("image_url")
         
@@ -265,10 +560,17 @@ class BRIAAPIClient:
             PIL Image object
         """
         try:
-            response = requests.get(image_url, timeout=30)
-            response.raise_for_status()
-            return Image.open(BytesIO(response.content))
-        except requests.exceptions.RequestException as e:
+            # Hand PIL the response stream and decode while the connection is
+            # still open - the body is not held as a separate bytes object for
+            # the image's lifetime, and a truncated download fails here rather
+            # than at first use
+            with self.session.get(image_url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                image = Image.open(response.raw)
+                image.load()
+            return image
+        except (requests.exceptions.RequestException, OSError) as e:
             raise Exception(f"Failed to download image: {str(e)}")
     
     def _decode_base64_image(self, image_data: str) -> Image.Image:
@@ -284,7 +586,7 @@ class BRIAAPIClient:
         try:
             # Remove data URI prefix if present
             if isinstance(image_data, str) and "," in image_data:
-                image_data = image_data.split(",")[1]
+                image_data = image_data.partition(",")[2]
             
             image_bytes = base64.b64decode(image_data)
             return Image.open(BytesIO(image_bytes))
@@ -303,56 +605,52 @@ class BRIAAPIClient:
             Enhanced prompt string
         """
         prompt_parts = [scene_description]
+        get = fibo_params.get
         
         # Add camera information
-        camera = fibo_params.get("camera", {})
+        camera = get("camera")
         if camera:
-            angle = camera.get("angle", "")
-            fov = camera.get("fov", "")
-            movement = camera.get("movement", "")
+            angle = camera.get("angle")
+            fov = camera.get("fov")
+            movement = camera.get("movement")
             
             camera_desc = []
             if angle and angle != "eye_level":
                 camera_desc.append(f"{angle} angle")
             if fov:
-                if fov < 30:
-                    camera_desc.append("close-up shot")
-                elif fov < 50:
-                    camera_desc.append("medium shot")
-                else:
-                    camera_desc.append("wide shot")
+                camera_desc.append(_FOV_SHOTS[bisect_right(_FOV_BOUNDS, fov)])
             if movement and movement != "static":
-                camera_desc.append(f"{movement.replace('_', ' ')}")
+                camera_desc.append(movement.translate(_UNDERSCORE_TO_SPACE))
             
             if camera_desc:
-                prompt_parts.append(f"Camera: {', '.join(camera_desc)}")
+                prompt_parts.append("Camera: " + ", ".join(camera_desc))
         
         # Add lighting information
-        lighting = fibo_params.get("lighting", {})
+        lighting = get("lighting")
         if lighting:
-            time_of_day = lighting.get("time_of_day", "")
-            style = lighting.get("style", "")
+            time_of_day = lighting.get("time_of_day")
+            style = lighting.get("style")
             
             lighting_desc = []
             if time_of_day:
-                lighting_desc.append(time_of_day.replace("_", " "))
+                lighting_desc.append(time_of_day.translate(_UNDERSCORE_TO_SPACE))
             if style:
                 lighting_desc.append(f"{style} lighting")
             
             if lighting_desc:
-                prompt_parts.append(f"Lighting: {', '.join(lighting_desc)}")
+                prompt_parts.append("Lighting: " + ", ".join(lighting_desc))
         
         # Add color information
-        color = fibo_params.get("color", {})
+        color = get("color")
         if color:
-            palette = color.get("palette", "")
+            palette = color.get("palette")
             if palette and palette != "neutral":
                 prompt_parts.append(f"Color palette: {palette}")
         
         # Add composition
-        composition = fibo_params.get("composition", {})
+        composition = get("composition")
         if composition:
-            framing = composition.get("framing", "")
+            framing = composition.get("framing")
             if framing:
                 prompt_parts.append(f"Framing: {framing}")
         
@@ -389,9 +687,7 @@ class BRIAAPIClient:
         }
         
         try:
-            response = requests.post(url, json=payload, headers=self.headers, timeout=30)
-            response.raise_for_status()
-            return response.json()
+            return self._post_json(url, payload)
         except requests.exceptions.RequestException as e:
             raise Exception(f"BRIA API edit request failed: {str(e)}")
     
@@ -416,22 +712,7 @@ class BRIAAPIClient:
             sync=sync
         )
         
-        if sync and "image_url" in response:
-            return self._download_image(response["image_url"])
-        
-        # Async handling
-        request_id = response.get("request_id")
-        if not request_id:
-            raise Exception("No request_id in response")
-        
-        final_status = self.wait_for_completion(request_id)
-        result = final_status.get("result", {})
-        image_url = result.get("image_url")
-        
-        if not image_url:
-            raise Exception("No image_url in result")
-        
-        return self._download_image(image_url)
+        return self._resolve_image_response(response, sync)
     
     def generative_fill(self, image_url: str,
                        prompt: str,
@@ -466,22 +747,7 @@ class BRIAAPIClient:
             mask_url=mask_url
         )
         
-        if sync and "image_url" in response:
-            return self._download_image(response["image_url"])
-        
-        # Async handling
-        request_id = response.get("request_id")
-        if not request_id:
-            raise Exception("No request_id in response")
-        
-        final_status = self.wait_for_completion(request_id)
-        result = final_status.get("result", {})
-        image_url = result.get("image_url")
-        
-        if not image_url:
-            raise Exception("No image_url in result")
-        
-        return self._download_image(image_url)
+        return self._resolve_image_response(response, sync)
     
     def erase_object(self, image_url: str,
                     mask_url: Optional[str] = None,
@@ -517,22 +783,7 @@ class BRIAAPIClient:
             mask_url=mask_url
         )
         
-        if sync and "image_url" in response:
-            return self._download_image(response["image_url"])
-        
-        # Async handling
-        request_id = response.get("request_id")
-        if not request_id:
-            raise Exception("No request_id in response")
-        
-        final_status = self.wait_for_completion(request_id)
-        result = final_status.get("result", {})
-        image_url = result.get("image_url")
-        
-        if not image_url:
-            raise Exception("No image_url in result")
-        
-        return self._download_image(image_url)
+        return self._resolve_image_response(response, sync)
     
     def replace_background(self, image_url: str,
                           background_prompt: str,
@@ -555,22 +806,7 @@ class BRIAAPIClient:
             sync=sync
         )
         
-        if sync and "image_url" in response:
-            return self._download_image(response["image_url"])
-        
-        # Async handling
-        request_id = response.get("request_id")
-        if not request_id:
-            raise Exception("No request_id in response")
-        
-        final_status = self.wait_for_completion(request_id)
-        result = final_status.get("result", {})
-        image_url = result.get("image_url")
-        
-        if not image_url:
-            raise Exception("No image_url in result")
-        
-        return self._download_image(image_url)
+        return self._resolve_image_response(response, sync)
     
     def upscale_image(self, image_url: str,
                      scale_factor: int = 2,
@@ -586,6 +822,19 @@ class BRIAAPIClient:
         Returns:
             Upscaled PIL Image
         """
+        key = self._request_key("upscale", {"image_url": image_url, "scale_factor": scale_factor})
+        
+        def upscale():
+            image = self._cached_image(key)
+            if image is None:
+                image = self._upscale_image(image_url, scale_factor, sync)
+                self._store_image(key, image)
+            return image
+        
+        return self._single_flight(key, upscale)
+    
+    def _upscale_image(self, image_url: str, scale_factor: int, sync: bool) -> Image.Image:
+        """Upscale an image through the API, bypassing the cache"""
         url = f"{self.BASE_URL}/upscale"
         
         payload = {
@@ -595,26 +844,8 @@ class BRIAAPIClient:
         }
         
         try:
-            response = requests.post(url, json=payload, headers=self.headers, timeout=30)
-            response.raise_for_status()
-            result = response.json()
-            
-            if sync and "image_url" in result:
-                return self._download_image(result["image_url"])
-            
-            # Async handling
-            request_id = result.get("request_id")
-            if not request_id:
-                raise Exception("No request_id in response")
-            
-            final_status = self.wait_for_completion(request_id)
-            result_data = final_status.get("result", {})
-            image_url = result_data.get("image_url")
-            
-            if not image_url:
-                raise Exception("No image_url in result")
-            
-            return self._download_image(image_url)
+            response = self._post_json(url, payload)
+            return self._resolve_image_response(response, sync)
         except requests.exceptions.RequestException as e:
             raise Exception(f"BRIA API upscale request failed: {str(e)}")
     
@@ -661,9 +892,7 @@ class BRIAAPIClient:
             payload["image_url"] = image_url
         
         try:
-            response = requests.post(url, json=payload, headers=self.headers, timeout=60)
-            response.raise_for_status()
-            return response.json()
+            return self._post_json(url, payload, timeout=60)
         except requests.exceptions.RequestException as e:
             raise Exception(f"BRIA API video generation failed: {str(e)}")
     
@@ -765,12 +994,60 @@ class BRIAAPIClient:
             payload["prompt"] = prompt
         
         try:
-            response = requests.post(url, json=payload, headers=self.headers, timeout=60)
-            response.raise_for_status()
-            return response.json()
+            return self._post_json(url, payload, timeout=60)
         except requests.exceptions.RequestException as e:
             raise Exception(f"BRIA API video edit failed: {str(e)}")
     
+    # ========== BATCH METHODS ==========
+    
+    def _run_batch(self, call, requests_kwargs: List[Dict], max_workers: Optional[int]) -> List:
+        """
+        Run independent API calls concurrently over the shared session
+        
+        Args:
+            call: Client method to call
+            requests_kwargs: Keyword arguments for each call
+            max_workers: Max concurrent calls (default: FIBO_BATCH)
+            
+        Returns:
+            Results in the order of requests_kwargs (the first failure is raised)
+        """
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+        
+        if not requests_kwargs:
+            return []
+        if max_workers is None:
+            max_workers = FIBO_BATCH
+        max_workers = max(1, min(len(requests_kwargs), max_workers))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(call, **kwargs) for kwargs in requests_kwargs]
+            done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            
+            # Once one call has failed the batch has failed - calls that haven't
+            # started yet are cancelled rather than billed (running ones finish)
+            for future in not_done:
+                future.cancel()
+            for future in futures:
+                if future in done and future.exception() is not None:
+                    raise future.exception()
+            
+            return [future.result() for future in futures]
+    
+    def generate_videos_batch(self, requests_kwargs: List[Dict],
+                              max_workers: Optional[int] = None) -> List[str]:
+        """
+        Generate several videos concurrently
+        
+        Args:
+            requests_kwargs: generate_video_sync keyword arguments for each video
+            max_workers: Max concurrent requests (default: FIBO_BATCH)
+            
+        Returns:
+            Video URLs in request order
+        """
+        return self._run_batch(self.generate_video_sync, requests_kwargs, max_workers)
+    
     # ========== UTILITY METHODS ==========
     
     def image_to_base64(self, image: Image.Image) -> str:
@@ -783,8 +1060,10 @@ class BRIAAPIClient:
         Returns:
             Base64 encoded string (without data URI prefix)
         """
+        # Fastest zlib level - BRIA re-encodes the upload anyway, so a ~20%
+        # larger payload is a good trade for several times faster encoding
         buffer = BytesIO()
-        image.save(buffer, format='PNG')
+        image.save(buffer, format='PNG', compress_level=1)
         img_bytes = buffer.getvalue()
-        return base64.b64encode(img_bytes).decode('utf-8')
+        return base64.b64encode(img_bytes).decode('ascii')
 
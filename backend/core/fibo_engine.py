@@ -6,11 +6,19 @@ Handles image generation using FIBO with JSON control via BRIA AI API
 from typing import List, Dict, Optional
 from PIL import Image
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import os
-import base64
+try:
+    # Prefer pybase64's vectorized encoder for frame PNGs
+    import pybase64 as base64
+except ImportError:
+    import base64
 from io import BytesIO
-from .bria_client import BRIAAPIClient
+from .bria_client import BRIAAPIClient, FIBO_BATCH
+
+# zlib level for frame PNGs sent to the frontend. 1 encodes several times
+# faster than PIL's default 6 for a slightly larger payload.
+PNG_COMPRESS_LEVEL = int(os.getenv("FIBO_PNG_LEVEL", "1"))
 
 
 @dataclass
@@ -20,21 +28,60 @@ class Frame:
     image: Image.Image
     params: Dict
     hdr_image: Optional[np.ndarray] = None  # 16-bit HDR data
+    # (image, data URL) pair from the last encode, reused while image is unchanged
+    _encoded: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    @classmethod
+    def from_data_url(cls, scene_number: int, data_url: str, params: Dict) -> "Frame":
+        """Decode a frame posted back by the frontend, keeping its data URL so it isn't re-encoded"""
+        image = Image.open(BytesIO(base64.b64decode(data_url.partition(",")[2])))
+        frame = cls(scene_number=scene_number, image=image, params=params)
+        frame._encoded = (image, data_url)
+        return frame
+    
+    def image_data_url(self) -> str:
+        """Encode the frame image as a PNG data URL (cached until image is replaced)"""
+        if self._encoded is None or self._encoded[0] is not self.image:
+            img_buffer = BytesIO()
+            self.image.save(img_buffer, format='PNG', compress_level=PNG_COMPRESS_LEVEL)
+            img_base64 = base64.b64encode(img_buffer.getvalue()).decode('utf-8')
+            self._encoded = (self.image, f"data:image/png;base64,{img_base64}")
+        return self._encoded[1]
     
     def to_dict(self) -> Dict:
         """Convert frame to dictionary for API response"""
-        # Convert image to base64
-        img_buffer = BytesIO()
-        self.image.save(img_buffer, format='PNG')
-        img_base64 = base64.b64encode(img_buffer.getvalue()).decode('utf-8')
-        
         return {
             "scene_number": self.scene_number,
-            "image": f"data:image/png;base64,{img_base64}",
+            "image": self.image_data_url(),
             "params": self.params
         }
 
 
+def encode_frames(frames: List[Frame]):
+    """
+    Encode the frames' data URLs in parallel, ahead of a serial to_dict() pass
+    
+    PIL's PNG encoder and base64 release the GIL, so a storyboard's frames
+    encode on all cores instead of one after another. Frames whose encoding
+    is already cached are skipped.
+    
+    Args:
+        frames: Frames to encode
+    """
+    pending = [
+        frame for frame in frames
+        if frame._encoded is None or frame._encoded[0] is not frame.image
+    ]
+    if len(pending) < 2:
+        for frame in pending:
+            frame.image_data_url()
+        return
+    
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 1)) as executor:
+        list(executor.map(Frame.image_data_url, pending))
+
+
 class ConsistencyEngine:
     """Maintains visual consistency across frames"""
     
@@ -161,7 +208,8 @@ class FIBOGenerator:
     def __init__(self, api_token: Optional[str] = None,
                  hdr_enabled: bool = True,
                  image_width: int = 1920,
-                 image_height: int = 1080):
+                 image_height: int = 1080,
+                 bria_client: Optional[BRIAAPIClient] = None):
         """
         Initialize FIBO generator with BRIA API
         
@@ -170,6 +218,7 @@ class FIBOGenerator:
             hdr_enabled: Enable HDR/16-bit output
             image_width: Generated image width (default: 1920)
             image_height: Generated image height (default: 1080)
+            bria_client: Existing BRIA client to share (instead of building one from api_token)
         """
         self.hdr_enabled = hdr_enabled
         self.image_width = image_width
@@ -177,7 +226,9 @@ class FIBOGenerator:
         self.consistency_engine = ConsistencyEngine()
         
         # Initialize BRIA API client
-        self.bria_client = None
+        self.bria_client = bria_client
+        if bria_client is not None:
+            return
         try:
             if api_token:
                 self.bria_client = BRIAAPIClient(api_token=api_token)
@@ -392,7 +443,9 @@ class FIBOGenerator:
     
     def create_storyboard(self, scenes: List,
                          translator,
-                         custom_params: Optional[Dict] = None) -> 'Storyboard':
+                         custom_params: Optional[Dict] = None,
+                         batch_size: Optional[int] = None,
+                         encode_frames: bool = False) -> 'Storyboard':
         """
         Generate storyboard from multiple scenes with parallel processing
         
@@ -400,18 +453,16 @@ class FIBOGenerator:
             scenes: List of Scene objects
             translator: LLMTranslator instance
             custom_params: Optional custom FIBO parameters to override defaults
+            batch_size: Max concurrent generation requests (default: FIBO_BATCH)
+            encode_frames: PNG-encode each frame in its worker as soon as it is
+                generated, overlapping encoding with the other scenes' requests
             
         Returns:
             Storyboard object
         """
-        import sys
-        from pathlib import Path
         from concurrent.futures import ThreadPoolExecutor, as_completed
-        
-        backend_dir = Path(__file__).parent.parent
-        if str(backend_dir) not in sys.path:
-            sys.path.insert(0, str(backend_dir))
-        from core.storyboard import Storyboard
+        # Imported here to avoid a circular import (storyboard imports Frame)
+        from .storyboard import Storyboard
         
         def deep_merge(base, override):
             """Deep merge two dictionaries"""
@@ -483,6 +534,9 @@ class FIBOGenerator:
                 
                 # Store scene description in frame params for later retrieval
                 frame.params['scene_description'] = data["scene"].description
+                
+                if encode_frames:
+                    frame.image_data_url()
                 return frame
             except Exception as e:
                 print(f"Error generating frame for scene {data['scene'].number}: {e}")
@@ -501,9 +555,14 @@ class FIBOGenerator:
                     params={'error': str(e), 'scene_description': data["scene"].description}
                 )
 
+        if not prepared_data:
+            return Storyboard([])
+        
         # Use parallel processing for image generation
         # Limit concurrent requests to avoid overwhelming the API
-        max_workers = min(len(prepared_data), 5)  # Max 5 concurrent requests
+        if batch_size is None:
+            batch_size = FIBO_BATCH
+        max_workers = max(1, min(len(prepared_data), batch_size))
         frames = [None] * len(prepared_data)
         
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
@@ -3,13 +3,24 @@ LLM Translation Service
 Converts natural language descriptions to FIBO JSON format
 """
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Callable
+from collections import OrderedDict
+import threading
+import hashlib
+import copy
 import json
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# LLM translations keyed by a hash of (provider, prompt), shared by every
+# translator instance. Regenerating a storyboard re-sends the same scenes,
+# so repeat translations skip the API round trip.
+_TRANSLATION_CACHE_SIZE = 512
+_translation_cache: "OrderedDict[str, Dict]" = OrderedDict()
+_translation_cache_lock = threading.Lock()
+
 
 class LLMTranslator:
     """Translates natural language to FIBO JSON using LLM"""
@@ -97,49 +108,85 @@ FIBO JSON Schema:
 Return ONLY valid JSON matching this schema. Do not include any explanation or markdown formatting.
 """
     
+    def _cached_translation(self, prompt: str, request: Callable[[str], Dict]) -> Dict:
+        """
+        Return a cached LLM translation, calling the API only on a miss
+        
+        Args:
+            prompt: Translation prompt
+            request: Function performing the API call (errors are not cached)
+            
+        Returns:
+            FIBO JSON parameters (a private copy the caller may modify)
+        """
+        key = hashlib.blake2b(f"{self.provider}\0{prompt}".encode("utf-8"), digest_size=16).hexdigest()
+        
+        with _translation_cache_lock:
+            cached = _translation_cache.get(key)
+            if cached is not None:
+                _translation_cache.move_to_end(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        result = request(prompt)
+        
+        with _translation_cache_lock:
+            _translation_cache[key] = copy.deepcopy(result)
+            if len(_translation_cache) > _TRANSLATION_CACHE_SIZE:
+                _translation_cache.popitem(last=False)
+        return result
+    
     def _translate_openai(self, prompt: str) -> Dict:
         """Translate using OpenAI API"""
         try:
-            from openai import OpenAI
-            client = OpenAI(api_key=self.api_key)
-            
-            response = client.chat.completions.create(
-                model="gpt-4-turbo-preview",
-                messages=[
-                    {"role": "system", "content": "You are a cinematography expert that converts scene descriptions to FIBO JSON format. Always return valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"}
-            )
-            
-            return json.loads(response.choices[0].message.content)
+            return self._cached_translation(prompt, self._request_openai)
         except Exception as e:
             print(f"OpenAI translation error: {e}")
             return self._rule_based_translation({})
     
+    def _request_openai(self, prompt: str) -> Dict:
+        """Call OpenAI API for a translation"""
+        from openai import OpenAI
+        client = OpenAI(api_key=self.api_key)
+        
+        response = client.chat.completions.create(
+            model="gpt-4-turbo-preview",
+            messages=[
+                {"role": "system", "content": "You are a cinematography expert that converts scene descriptions to FIBO JSON format. Always return valid JSON only."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.3,
+            response_format={"type": "json_object"}
+        )
+        
+        return json.loads(response.choices[0].message.content)
+    
     def _translate_anthropic(self, prompt: str) -> Dict:
         """Translate using Anthropic API"""
         try:
-            from anthropic import Anthropic
-            client = Anthropic(api_key=self.api_key)
-            
-            response = client.messages.create(
-                model="claude-3-opus-20240229",
-                max_tokens=1024,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
-            
-            content = response.content[0].text
-            # Extract JSON from response
-            json_str = self._extract_json(content)
-            return json.loads(json_str)
+            return self._cached_translation(prompt, self._request_anthropic)
         except Exception as e:
             print(f"Anthropic translation error: {e}")
             return self._rule_based_translation({})
     
+    def _request_anthropic(self, prompt: str) -> Dict:
+        """Call Anthropic API for a translation"""
+        from anthropic import Anthropic
+        client = Anthropic(api_key=self.api_key)
+        
+        response = client.messages.create(
+            model="claude-3-opus-20240229",
+            max_tokens=1024,
+            messages=[
+                {"role": "user", "content": prompt}
+            ]
+        )
+        
+        content = response.content[0].text
+        # Extract JSON from response
+        json_str = self._extract_json(content)
+        return json.loads(json_str)
+    
     def _extract_json(self, text: str) -> str:
         """Extract JSON from LLM response"""
         # Try to find JSON in code blocks
@@ -0,0 +1,215 @@
+"""
+Saved Scene Library
+SQLite index for scenes saved from the storyboard editor, with each
+scene image kept next to it as a raw PNG, JPEG or WebP file
+"""
+
+from typing import List, Dict, Optional
+from contextlib import closing
+from pathlib import Path
+import sqlite3
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+import json
+
+# Columns returned for a scene (the legacy inline "image" column is not)
+SCENE_COLUMNS = "id, scene_number, name, description, params, timestamp"
+
+# Scene image file extensions - images are stored in the format they were posted in
+IMAGE_EXTENSIONS = ("png", "jpeg", "webp")
+
+
+class SceneLibrary:
+    """Stores saved scenes in a single SQLite database"""
+    
+    # Bumped whenever the schema or on-disk layout changes
+    # 1: legacy JSON files imported, 2: images moved out to {id}.png
+    SCHEMA_VERSION = 2
+    
+    def __init__(self, saved_dir: Path):
+        """
+        Open (and create if needed) the scene library
+        
+        Args:
+            saved_dir: Directory holding the database (and any legacy
+                per-scene JSON files, which are imported once)
+        """
+        self.saved_dir = Path(saved_dir)
+        self.saved_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.saved_dir / "scenes.db"
+        
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS scenes ("
+                "id TEXT PRIMARY KEY, "
+                "scene_number INTEGER, "
+                "name TEXT, "
+                "description TEXT, "
+                "params TEXT, "
+                "timestamp TEXT, "
+                "image TEXT)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_scenes_timestamp ON scenes(timestamp DESC)")
+            
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < 1:
+                self._import_legacy_json(conn)
+            if version < 2:
+                self._externalize_images(conn)
+            if version < self.SCHEMA_VERSION:
+                conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection (one per call, so the library is safe across threads)"""
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+    
+    def _import_legacy_json(self, conn: sqlite3.Connection):
+        """Import scenes saved as {id}.json files before the library existed"""
+        for file_path in self.saved_dir.glob("*.json"):
+            try:
+                with open(file_path, 'r') as f:
+                    scene_data = json.load(f)
+                scene_data.setdefault("id", file_path.stem)
+                self._insert(conn, scene_data, replace=False)
+            except Exception as e:
+                print(f"Error importing {file_path}: {e}")
+    
+    def _externalize_images(self, conn: sqlite3.Connection):
+        """Move base64 images stored inline in the table out to PNG files"""
+        rows = conn.execute("SELECT id, image FROM scenes WHERE image IS NOT NULL").fetchall()
+        for row in rows:
+            try:
+                self._write_image(row["id"], decode_data_url(row["image"]))
+                conn.execute("UPDATE scenes SET image = NULL WHERE id = ?", (row["id"],))
+            except Exception as e:
+                print(f"Error moving image for scene {row['id']}: {e}")
+    
+    def _write_image(self, scene_id: str, image_bytes: bytes, extension: str = "png"):
+        """Write a scene image to disk, replacing one saved in another format"""
+        self._remove_images(scene_id)
+        (self.saved_dir / f"{scene_id}.{extension}").write_bytes(image_bytes)
+    
+    def _remove_images(self, scene_id: str) -> bool:
+        """Delete a scene's image files, returning whether there were any"""
+        removed = False
+        for extension in IMAGE_EXTENSIONS:
+            file_path = self.saved_dir / f"{scene_id}.{extension}"
+            if file_path.exists():
+                file_path.unlink()
+                removed = True
+        return removed
+    
+    def image_path(self, scene_id: str) -> Path:
+        """
+        Path of the file holding a scene's image
+        
+        Args:
+            scene_id: ID of the scene
+        
+        Returns:
+            Path of the image file ({id}.png, .jpeg or .webp), or of {id}.png
+            if the scene has no image
+        """
+        for extension in IMAGE_EXTENSIONS:
+            file_path = self.saved_dir / f"{scene_id}.{extension}"
+            if file_path.exists():
+                return file_path
+        return self.saved_dir / f"{scene_id}.png"
+    
+    def _insert(self, conn: sqlite3.Connection, scene_data: Dict, replace: bool = True):
+        """Insert one scene record"""
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        conn.execute(
+            f"{verb} INTO scenes (id, scene_number, name, description, params, timestamp, image) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                scene_data["id"],
+                scene_data.get("scene_number", 0),
+                scene_data.get("name"),
+                scene_data.get("description", ""),
+                json.dumps(scene_data.get("params", {})),
+                scene_data.get("timestamp"),
+                scene_data.get("image")
+            )
+        )
+    
+    @staticmethod
+    def _row_to_scene(row: sqlite3.Row) -> Dict:
+        """Convert a database row back into the saved scene dictionary"""
+        scene = dict(row)
+        scene["params"] = json.loads(scene["params"]) if scene["params"] else {}
+        return scene
+    
+    def save_scene(self, scene_data: Dict, image_bytes: Optional[bytes] = None, extension: str = "png"):
+        """
+        Save (or overwrite) a scene
+        
+        Args:
+            scene_data: Scene dictionary with at least an "id" key
+            image_bytes: Raw bytes of the scene image
+            extension: Image file extension matching the bytes (png, jpeg or webp)
+        """
+        if image_bytes is not None:
+            if extension not in IMAGE_EXTENSIONS:
+                raise ValueError(f"Unsupported scene image extension: {extension}")
+            self._write_image(scene_data["id"], image_bytes, extension)
+        
+        scene_data = {key: value for key, value in scene_data.items() if key != "image"}
+        with closing(self._connect()) as conn, conn:
+            self._insert(conn, scene_data)
+    
+    def list_scenes(self) -> List[Dict]:
+        """
+        List all saved scenes, newest first
+        
+        Returns:
+            List of scene dictionaries
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute(f"SELECT {SCENE_COLUMNS} FROM scenes ORDER BY timestamp DESC").fetchall()
+        return [self._row_to_scene(row) for row in rows]
+    
+    def get_scene(self, scene_id: str) -> Optional[Dict]:
+        """
+        Get a saved scene by ID
+        
+        Args:
+            scene_id: ID of the scene
+        
+        Returns:
+            Scene dictionary, or None if not found
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(f"SELECT {SCENE_COLUMNS} FROM scenes WHERE id = ?", (scene_id,)).fetchone()
+        return self._row_to_scene(row) if row else None
+    
+    def delete_scene(self, scene_id: str) -> bool:
+        """
+        Delete a saved scene
+        
+        Args:
+            scene_id: ID of the scene
+        
+        Returns:
+            True if the scene existed
+        """
+        with closing(self._connect()) as conn, conn:
+            deleted = conn.execute("DELETE FROM scenes WHERE id = ?", (scene_id,)).rowcount > 0
+        
+        # Remove the image, and the legacy file so it can never be imported again
+        if self._remove_images(scene_id):
+            deleted = True
+        legacy_path = self.saved_dir / f"{scene_id}.json"
+        if legacy_path.exists():
+            legacy_path.unlink()
+            deleted = True
+        return deleted
+
+
+def decode_data_url(image: str) -> bytes:
+    """Decode a base64 image, with or without its "data:image/...;base64," header"""
+    return base64.b64decode(image.partition(",")[2] if image.startswith("data:") else image)
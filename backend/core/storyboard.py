@@ -4,7 +4,7 @@ Storyboard Data Structure and Export Functions
 
 from typing import List, Optional
 from dataclasses import dataclass
-from .fibo_engine import Frame
+from .fibo_engine import Frame, encode_frames
 import os
 
 
@@ -15,13 +15,14 @@ class Storyboard:
     
     def to_dict(self) -> dict:
         """Convert storyboard to dictionary for API response"""
+        encode_frames(self.frames)
         return {
             "frames": [frame.to_dict() for frame in self.frames],
             "frame_count": len(self.frames)
         }
     
-    def export_pdf(self, output_path: str):
-        """Export storyboard as PDF"""
+    def export_pdf(self, output_path):
+        """Export storyboard as PDF to a file path or writable binary file object"""
         try:
             from reportlab.lib.pagesizes import letter, A4
             from reportlab.lib.units import inch
@@ -91,7 +92,8 @@ class Storyboard:
                 story.append(Spacer(1, 0.2*inch))
             
             doc.build(story)
-            print(f"PDF exported to {output_path}")
+            if isinstance(output_path, str):
+                print(f"PDF exported to {output_path}")
             return True
             
         except ImportError as e:
@@ -239,25 +241,22 @@ class Storyboard:
         try:
             import requests
             
-            # Generate video for each frame
-            video_urls = []
+            # Generate a video for each frame - the requests are independent,
+            # so they run concurrently rather than one after another
+            encode_frames(self.frames)
+            video_requests = []
             for frame in self.frames:
-                # Convert frame to base64
-                frame_base64 = bria_client.image_to_base64(frame.image)
-                
-                # Build prompt from frame parameters
-                prompt = self._build_video_prompt(frame)
-                
-                # Generate video from frame
-                video_url = bria_client.generate_video_sync(
-                    prompt=prompt,
-                    image_url=f"data:image/png;base64,{frame_base64}",
-                    duration=duration_per_frame,
-                    fps=24,
-                    width=frame.image.width,
-                    height=frame.image.height
-                )
-                video_urls.append(video_url)
+                video_requests.append({
+                    "prompt": self._build_video_prompt(frame),
+                    # Reuses the frame's encoding when it was already sent to the frontend
+                    "image_url": frame.image_data_url(),
+                    "duration": duration_per_frame,
+                    "fps": 24,
+                    "width": frame.image.width,
+                    "height": frame.image.height
+                })
+            
+            video_urls = bria_client.generate_videos_batch(video_requests)
             
             # Download and concatenate videos
             # Note: This is a simplified version - full implementation would
@@ -287,22 +286,25 @@ class Storyboard:
         
         return ", ".join(prompt_parts) if prompt_parts else "Cinematic scene"
     
-    def enhance_frames(self, bria_client, upscale_factor: int = 2):
+    def enhance_frames(self, bria_client, upscale_factor: int = 2,
+                       concurrency: Optional[int] = None):
         """
         Enhance storyboard frames using BRIA upscaling
         
         Args:
             bria_client: BRIAAPIClient instance
             upscale_factor: Upscale factor (2, 4, etc.)
+            concurrency: Max concurrent upscale requests (default: FIBO_BATCH)
         """
-        for frame in self.frames:
+        from concurrent.futures import ThreadPoolExecutor
+        from .bria_client import FIBO_BATCH
+        
+        def enhance_frame(frame):
             try:
-                # Convert to base64
-                frame_base64 = bria_client.image_to_base64(frame.image)
-                
-                # Upscale image
+                # Upscale image (frames posted back by the frontend keep their
+                # original data URL, so there is no PNG re-encode here)
                 upscaled = bria_client.upscale_image(
-                    image_url=f"data:image/png;base64,{frame_base64}",
+                    image_url=frame.image_data_url(),
                     scale_factor=upscale_factor,
                     sync=True
                 )
@@ -312,4 +314,16 @@ class Storyboard:
                 print(f"Enhanced frame {frame.scene_number}")
             except Exception as e:
                 print(f"Error enhancing frame {frame.scene_number}: {e}")
+        
+        if not self.frames:
+            return
+        
+        # Upscale requests are independent network round trips, so run them
+        # concurrently (bounded, like storyboard generation) instead of in turn
+        if concurrency is None:
+            concurrency = FIBO_BATCH
+        max_workers = max(1, min(len(self.frames), concurrency))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(enhance_frame, self.frames))
 
@@ -5,12 +5,10 @@ Backend entry point - Run FastAPI server
 import uvicorn
 import sys
 import os
-from pathlib import Path
 
-# Add backend directory to path
-backend_dir = Path(__file__).parent
-if str(backend_dir) not in sys.path:
-    sys.path.insert(0, str(backend_dir))
+# Add backend directory to path (a duplicate entry is harmless)
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, backend_dir)
 
 if __name__ == "__main__":
     import sys
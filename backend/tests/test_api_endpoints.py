@@ -2,6 +2,7 @@
 Unit tests for API endpoints
 """
 import pytest
+import orjson
 from fastapi.testclient import TestClient
 from api.main import app
 import os
@@ -31,6 +32,27 @@ class TestHealthEndpoints:
         data = response.json()
         assert data["status"] == "healthy"
 
+    def test_api_health_endpoint(self):
+        """Test health endpoint under /api (readiness probe path)"""
+        response = client.get("/api/health")
+        assert response.status_code == 200
+        assert response.json()["status"] == "healthy"
+    
+    def test_lifespan_warms_and_closes_bria_client(self, tmp_path):
+        """Test the shared BRIA client is connected at startup and closed at shutdown"""
+        mock_bria = MagicMock()
+        
+        with patch('api.main._bria_client', mock_bria), \
+             patch('api.main.fibo_generator', MagicMock()), \
+             patch('api.main._scene_library', MagicMock()), \
+             patch('api.main._SAVED_STORYBOARDS_DIR', tmp_path):
+            with TestClient(app) as lifespan_client:
+                assert lifespan_client.get("/health").status_code == 200
+                mock_bria.close.assert_not_called()
+        
+        mock_bria.warm_up.assert_called_once()
+        mock_bria.close.assert_called_once()
+
 
 class TestScriptParsing:
     """Test script parsing endpoints"""
@@ -60,6 +82,18 @@ CLOSE-UP: Figure's face. Dramatic side lighting. Desaturated colors."""
         # Should return empty list or error
         assert response.status_code in [200, 400]
     
+    def test_parse_script_cached(self):
+        """Test repeated parses of the same script reuse the cached scenes"""
+        from api.main import _parse_script_cached
+        
+        script_content = "INT. DINER - NIGHT\n\nClose-up on a coffee cup."
+        client.post("/api/parse-script", json={"content": script_content})
+        hits = _parse_script_cached.cache_info().hits
+        
+        response = client.post("/api/parse-script", json={"content": script_content})
+        assert response.status_code == 200
+        assert _parse_script_cached.cache_info().hits == hits + 1
+    
     def test_upload_script_file(self):
         """Test uploading script file"""
         script_content = "EXT. CITY STREET - NIGHT\n\nWide establishing shot."
@@ -135,10 +169,376 @@ Wide establishing shot. Rain-soaked street, neon signs."""
         assert response.status_code in [400, 500]
 
 
+class TestFrameEditing:
+    """Test frame editing endpoint"""
+    
+    def test_edit_frame_webp(self):
+        """Test edited frame can be returned as WebP instead of PNG"""
+        mock_bria = MagicMock()
+        mock_bria.reimagine_image.return_value = Image.new('RGB', (64, 36), color='red')
+        body = {
+            "request": {"frame_index": 0, "edit_type": "reimagine", "prompt": "Rain"},
+            "storyboard_data": {"frames": [{"scene_number": 1, "image": "data:image/png;base64,dGVzdA==", "params": {}}]}
+        }
+        
+        with patch('api.main._bria_client', mock_bria):
+            response = client.post("/api/edit-frame?format=webp", json=body)
+            assert response.status_code == 200
+            image = response.json()["image"]
+            assert image.startswith("data:image/webp;base64,")
+            assert Image.open(io.BytesIO(base64.b64decode(image.split(",", 1)[1]))).format == "WEBP"
+            
+            response = client.post("/api/edit-frame?format=tiff", json=body)
+            assert response.status_code == 400
+    
+    def test_edit_frame_keeps_image_format(self):
+        """Test a posted WebP frame reaches BRIA with its own data URL header"""
+        mock_bria = MagicMock()
+        mock_bria.reimagine_image.return_value = Image.new('RGB', (64, 36), color='red')
+        buffer = io.BytesIO()
+        Image.new('RGB', (32, 18), color='blue').save(buffer, format='WEBP')
+        data_url = f"data:image/webp;base64,{base64.b64encode(buffer.getvalue()).decode()}"
+        body = {
+            "request": {"frame_index": 0, "edit_type": "reimagine", "prompt": "Rain"},
+            "storyboard_data": {"frames": [{"scene_number": 1, "image": data_url, "params": {}}]}
+        }
+        
+        with patch('api.main._bria_client', mock_bria):
+            response = client.post("/api/edit-frame", json=body)
+        
+        assert response.status_code == 200
+        assert mock_bria.reimagine_image.call_args[1]["image_url"] == data_url
+
+
+class TestStoryboardEnhancement:
+    """Test storyboard enhancement endpoint"""
+    
+    def test_enhance_reuses_posted_image(self):
+        """Test enhance uploads the frame's posted data URL rather than re-encoding it"""
+        buffer = io.BytesIO()
+        Image.new('RGB', (32, 18), color='blue').save(buffer, format='PNG')
+        data_url = f"data:image/png;base64,{base64.b64encode(buffer.getvalue()).decode()}"
+        
+        mock_bria = MagicMock()
+        mock_bria.upscale_image.return_value = Image.new('RGB', (64, 36), color='blue')
+        
+        with patch('api.main._bria_client', mock_bria):
+            response = client.post(
+                "/api/enhance-storyboard",
+                json={
+                    "storyboard_data": {"frames": [{"scene_number": 1, "image": data_url, "params": {}}]},
+                    "upscale_factor": 2
+                }
+            )
+        
+        assert response.status_code == 200
+        assert mock_bria.upscale_image.call_args[1]["image_url"] == data_url
+        assert len(response.json()["frames"]) == 1
+
+
+class TestSavedScenes:
+    """Test the saved scene library endpoints"""
+    
+    def test_save_list_get_delete_scene(self, tmp_path):
+        """Test a scene round-trips through the library"""
+        from core.scene_library import SceneLibrary
+        
+        with patch('api.main._scene_library', SceneLibrary(tmp_path)):
+            response = client.post("/api/save-scene", json={
+                "scene_number": 3,
+                "image": "data:image/png;base64,dGVzdA==",
+                "params": {"camera": {"fov": 60}},
+                "description": "Rooftop at dusk",
+                "name": "  Rooftop  "
+            })
+            assert response.status_code == 200
+            scene_id = response.json()["scene_id"]
+            
+            listed = client.get("/api/saved-scenes").json()
+            assert listed["count"] == 1
+            assert listed["scenes"][0]["id"] == scene_id
+            assert listed["scenes"][0]["name"] == "Rooftop"
+            assert listed["scenes"][0]["params"] == {"camera": {"fov": 60}}
+            assert listed["scenes"][0]["thumbnail"] == f"/api/saved-scene/{scene_id}/image"
+            
+            scene = client.get(f"/api/saved-scene/{scene_id}").json()["scene"]
+            assert scene["description"] == "Rooftop at dusk"
+            
+            # Image is stored as raw bytes and served directly
+            image = client.get(scene["image"])
+            assert image.status_code == 200
+            assert image.headers["content-type"] == "image/png"
+            assert image.content == b"test"
+            
+            assert client.delete(f"/api/saved-scene/{scene_id}").status_code == 200
+            assert client.get(f"/api/saved-scene/{scene_id}").status_code == 404
+            assert client.delete(f"/api/saved-scene/{scene_id}").status_code == 404
+    
+    def test_save_jpeg_scene(self, tmp_path):
+        """Test a JPEG scene is stored and served as JPEG, not labelled PNG"""
+        from core.scene_library import SceneLibrary
+        
+        buffer = io.BytesIO()
+        Image.new('RGB', (8, 8), color='red').save(buffer, format='JPEG')
+        jpeg_bytes = buffer.getvalue()
+        
+        with patch('api.main._scene_library', SceneLibrary(tmp_path)):
+            response = client.post("/api/save-scene", json={
+                "scene_number": 1,
+                "image": f"data:image/jpeg;base64,{base64.b64encode(jpeg_bytes).decode()}",
+                "params": {}
+            })
+            assert response.status_code == 200
+            scene_id = response.json()["scene_id"]
+            assert (tmp_path / f"{scene_id}.jpeg").read_bytes() == jpeg_bytes
+            assert not (tmp_path / f"{scene_id}.png").exists()
+            
+            image = client.get(f"/api/saved-scene/{scene_id}/image")
+            assert image.headers["content-type"] == "image/jpeg"
+            assert image.content == jpeg_bytes
+            
+            assert client.delete(f"/api/saved-scene/{scene_id}").status_code == 200
+            assert not (tmp_path / f"{scene_id}.jpeg").exists()
+    
+    def test_legacy_json_scenes_imported(self, tmp_path):
+        """Test scenes saved as JSON files before the library are still listed"""
+        from core.scene_library import SceneLibrary
+        import json
+        
+        (tmp_path / "legacy-id.json").write_text(json.dumps({
+            "id": "legacy-id",
+            "scene_number": 1,
+            "params": {},
+            "description": "Old scene",
+            "name": "Scene 1",
+            "timestamp": "2025-01-01T00:00:00",
+            "image": "data:image/png;base64,dGVzdA=="
+        }))
+        
+        library = SceneLibrary(tmp_path)
+        assert [scene["id"] for scene in library.list_scenes()] == ["legacy-id"]
+        assert library.image_path("legacy-id").read_bytes() == b"test"
+        
+        # Deleting removes the legacy file so a fresh index cannot re-import it
+        assert library.delete_scene("legacy-id")
+        assert not (tmp_path / "legacy-id.json").exists()
+        assert not library.image_path("legacy-id").exists()
+
+
+class TestSavedStoryboards:
+    """Test the saved storyboard endpoints"""
+    
+    def test_save_list_get_delete_storyboard(self, tmp_path):
+        """Test a storyboard round-trips through the saved storyboard endpoints"""
+        frames = [{"scene_number": 1, "image": "data:image/png;base64,dGVzdA==", "params": {"camera": {"fov": 60}}}]
+        
+        with patch('api.main._SAVED_STORYBOARDS_DIR', tmp_path):
+            response = client.post("/api/save-storyboard", json={"name": "Noir", "frames": frames})
+            assert response.status_code == 200
+            storyboard_id = response.json()["storyboard_id"]
+            
+            storyboard = client.get(f"/api/saved-storyboard/{storyboard_id}").json()
+            image_url = storyboard["frames"][0]["image"]
+            assert image_url == f"/api/saved-storyboard/{storyboard_id}/frames/frame_0.png"
+            assert storyboard["frames"][0]["params"] == frames[0]["params"]
+            assert storyboard["frame_count"] == 1
+            assert storyboard["name"] == "Noir"
+            assert storyboard["id"] == storyboard_id
+            assert client.get(image_url).content == b"test"
+            
+            listed = client.get("/api/saved-storyboards").json()
+            assert listed["count"] == 1
+            assert listed["storyboards"][0]["thumbnail"] == image_url
+            
+            # Saving a loaded storyboard again copies its frame images
+            response = client.post("/api/save-storyboard", json={"name": "Copy", "frames": storyboard["frames"]})
+            copy_id = response.json()["storyboard_id"]
+            copy = client.get(f"/api/saved-storyboard/{copy_id}").json()
+            assert client.get(copy["frames"][0]["image"]).content == b"test"
+            assert client.delete(f"/api/saved-storyboard/{copy_id}").status_code == 200
+            
+            assert client.delete(f"/api/saved-storyboard/{storyboard_id}").status_code == 200
+            assert client.get(f"/api/saved-storyboard/{storyboard_id}").status_code == 404
+            assert client.get(image_url).status_code == 404
+            assert client.get("/api/saved-storyboards").json()["count"] == 0
+    
+    def test_saved_frames_get_defaults(self, tmp_path):
+        """Test frames saved without params or scene_number come back with the defaults"""
+        from api.main import _migrate_storyboard_files
+        
+        frames = [{"image": "data:image/png;base64,dGVzdA=="}, {"scene_number": 5, "params": None}]
+        
+        with patch('api.main._SAVED_STORYBOARDS_DIR', tmp_path):
+            storyboard_id = client.post("/api/save-storyboard", json={"frames": frames}).json()["storyboard_id"]
+            storyboard = client.get(f"/api/saved-storyboard/{storyboard_id}").json()
+            assert storyboard["frames"] == [
+                {"scene_number": 1, "image": f"/api/saved-storyboard/{storyboard_id}/frames/frame_0.png", "params": {}},
+                {"scene_number": 5, "image": "", "params": {}}
+            ]
+            
+            # Files saved before frames were normalized are migrated in place
+            (tmp_path / "legacy.json").write_text('{"frames": [{"image": "data:image/png;base64,dGVzdA=="}]}')
+            _migrate_storyboard_files(tmp_path)
+            legacy = client.get("/api/saved-storyboard/legacy").json()
+        
+        assert legacy["id"] == "legacy"
+        assert legacy["name"] == "Unnamed Storyboard"
+        assert legacy["frames"] == [{"scene_number": 1, "image": "data:image/png;base64,dGVzdA==", "params": {}}]
+    
+    def test_save_storyboard_rejects_non_images(self, tmp_path):
+        """Test only PNG/JPEG/WebP data URLs, base64 and frame URLs are saved as frame images"""
+        buffer = io.BytesIO()
+        Image.new('RGB', (8, 8), color='red').save(buffer, format='JPEG')
+        bare_jpeg = base64.b64encode(buffer.getvalue()).decode()
+        
+        with patch('api.main._SAVED_STORYBOARDS_DIR', tmp_path):
+            response = client.post("/api/save-storyboard", json={"frames": [{"scene_number": 1, "image": bare_jpeg}]})
+            assert response.status_code == 200
+            storyboard_id = response.json()["storyboard_id"]
+            image_url = client.get(f"/api/saved-storyboard/{storyboard_id}").json()["frames"][0]["image"]
+            assert image_url.endswith("/frame_0.jpeg")
+            assert client.get(image_url).headers["content-type"] == "image/jpeg"
+            
+            for image in (
+                "/api/saved-scene/abc/image",
+                "https://example.com/frame.png",
+                "data:image/gif;base64,R0lGODlh",
+                "data:image/png;base64,not base64!",
+                base64.b64encode(b"not an image").decode()
+            ):
+                response = client.post("/api/save-storyboard", json={"frames": [{"scene_number": 1, "image": image}]})
+                assert response.status_code == 400, image
+            assert client.get("/api/saved-storyboards").json()["count"] == 1
+            assert len([path for path in tmp_path.iterdir() if path.is_dir()]) == 1
+    
+    def test_loaded_storyboard_edit_and_enhance(self, tmp_path):
+        """Test frames of a loaded storyboard (frame URLs) can be posted to edit-frame and enhance"""
+        buffer = io.BytesIO()
+        Image.new('RGB', (32, 18), color='blue').save(buffer, format='PNG')
+        data_url = f"data:image/png;base64,{base64.b64encode(buffer.getvalue()).decode()}"
+        
+        mock_bria = MagicMock()
+        mock_bria.reimagine_image.return_value = Image.new('RGB', (32, 18), color='red')
+        mock_bria.upscale_image.return_value = Image.new('RGB', (64, 36), color='blue')
+        
+        with patch('api.main._SAVED_STORYBOARDS_DIR', tmp_path), patch('api.main._bria_client', mock_bria):
+            frames = [{"scene_number": 1, "image": data_url, "params": {}}]
+            storyboard_id = client.post("/api/save-storyboard", json={"frames": frames}).json()["storyboard_id"]
+            storyboard = client.get(f"/api/saved-storyboard/{storyboard_id}").json()
+            assert storyboard["frames"][0]["image"].startswith("/api/")
+            
+            response = client.post("/api/edit-frame", json={
+                "request": {"frame_index": 0, "edit_type": "reimagine", "prompt": "Rain"},
+                "storyboard_data": storyboard
+            })
+            assert response.status_code == 200
+            assert mock_bria.reimagine_image.call_args[1]["image_url"] == data_url
+            
+            response = client.post("/api/enhance-storyboard", json={"storyboard_data": storyboard, "upscale_factor": 2})
+            assert response.status_code == 200
+            assert mock_bria.upscale_image.call_args[1]["image_url"] == data_url
+            
+            storyboard["frames"][0]["image"] = "/api/saved-scene/abc/image"
+            response = client.post("/api/enhance-storyboard", json={"storyboard_data": storyboard, "upscale_factor": 2})
+            assert response.status_code == 400
+    
+    def test_storyboard_msgpack(self, tmp_path):
+        """Test saved storyboards are served as MessagePack when the client asks for it"""
+        msgpack = pytest.importorskip("msgpack")
+        legacy = '{"id": "legacy", "name": "Legacy", "frames": [{"scene_number": 1, "image": "data:image/png;base64,dGVzdA=="}]}'
+        (tmp_path / "legacy.json").write_text(legacy)
+        
+        with patch('api.main._SAVED_STORYBOARDS_DIR', tmp_path):
+            response = client.get("/api/saved-storyboard/legacy", headers={"Accept": "application/msgpack"})
+            assert response.headers["content-type"] == "application/msgpack"
+            storyboard = msgpack.unpackb(response.content)
+            assert storyboard["name"] == "Legacy"
+            assert storyboard["frames"][0]["image"] == b"test"
+            
+            listed = msgpack.unpackb(client.get("/api/saved-storyboards", headers={"Accept": "application/msgpack"}).content)
+            assert listed["count"] == 1
+            
+            assert client.get("/api/saved-storyboard/legacy").json()["name"] == "Legacy"
+    
+    def test_storyboard_not_modified(self, tmp_path):
+        """Test a client holding the current copy gets 304 Not Modified"""
+        (tmp_path / "legacy.json").write_text('{"id": "legacy", "name": "Legacy", "frames": []}')
+        
+        with patch('api.main._SAVED_STORYBOARDS_DIR', tmp_path):
+            for url in ("/api/saved-storyboard/legacy", "/api/saved-storyboards"):
+                etag = client.get(url).headers["etag"]
+                response = client.get(url, headers={"If-None-Match": etag})
+                assert response.status_code == 304
+                assert response.content == b""
+    
+    def test_bulk_delete_storyboards(self, tmp_path):
+        """Test several storyboards are deleted in one request"""
+        with patch('api.main._SAVED_STORYBOARDS_DIR', tmp_path):
+            ids = [
+                client.post("/api/save-storyboard", json={"name": name, "frames": []}).json()["storyboard_id"]
+                for name in ("One", "Two", "Three")
+            ]
+            
+            response = client.post("/api/saved-storyboards/delete", json={"ids": ids[:2] + ["missing"]})
+            assert response.status_code == 200
+            assert response.json()["deleted"] == ids[:2]
+            assert response.json()["not_found"] == ["missing"]
+            
+            listed = client.get("/api/saved-storyboards").json()
+            assert [item["id"] for item in listed["storyboards"]] == ids[2:]
+    
+    def test_invalid_storyboard_id(self, tmp_path):
+        """Test IDs that could not have been saved are rejected before any file access"""
+        with patch('api.main._SAVED_STORYBOARDS_DIR', tmp_path):
+            assert client.get("/api/saved-storyboard/_index").status_code == 400
+            assert client.get("/api/saved-storyboard/..secret").status_code == 400
+            assert client.delete("/api/saved-storyboard/bad.id").status_code == 400
+    
+    def test_list_rebuilds_missing_index(self, tmp_path):
+        """Test storyboards saved before the list index existed are still listed"""
+        (tmp_path / "legacy.json").write_text('{"name": "Legacy", "frame_count": 2, "created_at": "2024-01-01"}')
+        
+        with patch('api.main._SAVED_STORYBOARDS_DIR', tmp_path):
+            listed = client.get("/api/saved-storyboards").json()
+        
+        assert listed["count"] == 1
+        assert listed["storyboards"][0]["id"] == "legacy"
+        assert listed["storyboards"][0]["name"] == "Legacy"
+    
+    def test_list_reconciles_index_with_files(self, tmp_path):
+        """Test storyboards added or removed outside the API are reflected in the list"""
+        frames = [{"scene_number": 1, "image": "data:image/png;base64,dGVzdA=="}]
+        
+        with patch('api.main._SAVED_STORYBOARDS_DIR', tmp_path):
+            storyboard_id = client.post("/api/save-storyboard", json={"frames": frames}).json()["storyboard_id"]
+            assert client.get("/api/saved-storyboards").json()["count"] == 1
+            
+            (tmp_path / f"{storyboard_id}.json").unlink()
+            (tmp_path / "copied.json").write_text('{"name": "Copied", "created_at": "2024-01-01"}')
+            listed = client.get("/api/saved-storyboards").json()
+        
+        assert [item["id"] for item in listed["storyboards"]] == ["copied"]
+    
+    def test_failed_index_update_is_rebuilt(self, tmp_path):
+        """Test a storyboard saved while the index update failed is still listed afterwards"""
+        frames = [{"scene_number": 1, "image": "data:image/png;base64,dGVzdA=="}]
+        
+        with patch('api.main._SAVED_STORYBOARDS_DIR', tmp_path):
+            client.post("/api/save-storyboard", json={"name": "First", "frames": frames})
+            with patch('api.main._write_storyboard_index', side_effect=OSError("disk full")):
+                response = client.post("/api/save-storyboard", json={"name": "Second", "frames": frames})
+            assert response.status_code == 500
+            assert not (tmp_path / "_index.json").exists()
+            
+            listed = client.get("/api/saved-storyboards").json()
+        
+        assert sorted(item["name"] for item in listed["storyboards"]) == ["First", "Second"]
+
+
 class TestBRIAAPIClient:
     """Test BRIA API client"""
     
-    @patch('core.bria_client.requests.post')
+    @patch('core.bria_client.requests.Session.post')
     def test_generate_image_endpoint(self, mock_post):
         """Test image generation endpoint format"""
         from core.bria_client import BRIAAPIClient
@@ -173,10 +573,10 @@ class TestBRIAAPIClient:
             assert mock_post.called
             call_args = mock_post.call_args
             assert "text-to-image/tailored/test_model" in call_args[0][0]
-            assert call_args[1]["json"]["prompt"] == "test prompt"
+            assert orjson.loads(call_args[1]["data"])["prompt"] == "test prompt"
             assert result["request_id"] == "test123"
     
-    @patch('core.bria_client.requests.post')
+    @patch('core.bria_client.requests.Session.post')
     def test_generate_video_endpoint(self, mock_post):
         """Test video generation endpoint format"""
         from core.bria_client import BRIAAPIClient
@@ -207,7 +607,7 @@ class TestBRIAAPIClient:
             assert mock_post.called
             call_args = mock_post.call_args
             assert "video/generate/tailored/image-to-video" in call_args[0][0]
-            assert call_args[1]["json"]["prompt"] == "test video prompt"
+            assert orjson.loads(call_args[1]["data"])["prompt"] == "test video prompt"
             assert result["request_id"] == "video123"
 
 
@@ -235,6 +635,19 @@ class TestLLMTranslator:
         # Verify FOV is set for wide shot
         assert result["camera"]["fov"] == 60
         assert result["lighting"]["time_of_day"] == "night"
+    
+    def test_llm_translation_cached(self):
+        """Test repeated LLM translations of a scene reuse the first API result"""
+        from core.llm_translator import LLMTranslator
+        
+        translator = LLMTranslator(provider="openai")
+        with patch.object(LLMTranslator, '_request_openai', return_value={"camera": {"fov": 35}}) as mock_request:
+            first = translator.translate_to_json("Cached rooftop chase at dusk.", {"shot_type": "wide"})
+            first["camera"]["fov"] = 90  # callers may modify their copy
+            second = LLMTranslator(provider="openai").translate_to_json("Cached rooftop chase at dusk.", {"shot_type": "wide"})
+        
+        assert mock_request.call_count == 1
+        assert second == {"camera": {"fov": 35}}
 
 
 class TestFIBOEngine:
@@ -281,6 +694,21 @@ class TestFIBOEngine:
         assert "Scene description" in prompt
         assert "high angle" in prompt or "wide shot" in prompt
         assert "golden hour" in prompt or "golden_hour" in prompt
+    
+    def test_encode_frames(self):
+        """Test parallel frame encoding matches encoding each frame on its own"""
+        from core.fibo_engine import Frame, encode_frames
+        
+        frames = [
+            Frame(scene_number=n, image=Image.new('RGB', (32, 18), color=color), params={})
+            for n, color in enumerate(['red', 'green', 'blue'], 1)
+        ]
+        encode_frames(frames)
+        
+        for frame in frames:
+            expected = Frame(scene_number=frame.scene_number, image=frame.image.copy(), params={})
+            assert frame._encoded[0] is frame.image
+            assert frame.image_data_url() == expected.image_data_url()
 
 
 class TestIntegration:
@@ -2,8 +2,10 @@
 Unit tests for BRIA API client
 """
 import pytest
+import orjson
 from unittest.mock import patch, MagicMock, Mock
 import os
+import time
 from core.bria_client import BRIAAPIClient
 from PIL import Image
 import requests
@@ -36,12 +38,27 @@ class TestBRIAAPIClientInit:
             client = BRIAAPIClient()
             # Should use default or env var if set
             assert "bria-api.com" in client.BASE_URL or "bria.ai" in client.BASE_URL
+    
+    def test_retry_policies(self):
+        """Test status polls retry transient errors while submissions only retry rejections"""
+        with patch.dict(os.environ, {'BRIA_API_TOKEN': 'test_token'}):
+            client = BRIAAPIClient()
+            
+            get_retry = client.session.get_adapter(f"{client.BASE_URL}/status/abc").max_retries
+            assert get_retry.allowed_methods == {"GET"}
+            assert 502 in get_retry.status_forcelist
+            assert get_retry.respect_retry_after_header
+            
+            post_retry = client.session.get_adapter(client.GENERATE_ENDPOINT).max_retries
+            assert post_retry.allowed_methods == {"POST"}
+            assert set(post_retry.status_forcelist) == {429, 503}
+            assert post_retry.total == 2
 
 
 class TestImageGeneration:
     """Test image generation methods"""
     
-    @patch('core.bria_client.requests.post')
+    @patch('core.bria_client.requests.Session.post')
     def test_generate_image_async(self, mock_post):
         """Test async image generation"""
         with patch.dict(os.environ, {
@@ -72,7 +89,7 @@ class TestImageGeneration:
             call_url = mock_post.call_args[0][0]
             assert "text-to-image/tailored/test_model" in call_url
             
-            call_data = mock_post.call_args[1]["json"]
+            call_data = orjson.loads(mock_post.call_args[1]["data"])
             assert call_data["prompt"] == "test prompt"
             assert call_data["width"] == 512
             assert call_data["height"] == 512
@@ -81,7 +98,7 @@ class TestImageGeneration:
             # Verify response
             assert result["request_id"] == "req123"
     
-    @patch('core.bria_client.requests.post')
+    @patch('core.bria_client.requests.Session.post')
     def test_generate_image_sync(self, mock_post):
         """Test sync image generation"""
         with patch.dict(os.environ, {
@@ -109,11 +126,11 @@ class TestImageGeneration:
                     model_id="test_model"
                 )
                 
-                call_data = mock_post.call_args[1]["json"]
+                call_data = orjson.loads(mock_post.call_args[1]["data"])
                 assert call_data["sync"] is True
     
-    @patch('core.bria_client.requests.post')
-    @patch('core.bria_client.requests.get')
+    @patch('core.bria_client.requests.Session.post')
+    @patch('core.bria_client.requests.Session.get')
     def test_generate_image_sync_async_fallback(self, mock_get, mock_post):
         """Test sync generation with async fallback"""
         with patch.dict(os.environ, {
@@ -156,7 +173,7 @@ class TestImageGeneration:
 class TestStatusChecking:
     """Test status checking methods"""
     
-    @patch('core.bria_client.requests.get')
+    @patch('core.bria_client.requests.Session.get')
     def test_check_status(self, mock_get):
         """Test status check"""
         with patch.dict(os.environ, {
@@ -180,7 +197,7 @@ class TestStatusChecking:
             assert "status/req123" in call_url
             assert result["status"] == "COMPLETED"
     
-    @patch('core.bria_client.requests.get')
+    @patch('core.bria_client.requests.Session.get')
     def test_wait_for_completion(self, mock_get):
         """Test waiting for completion"""
         import time
@@ -203,6 +220,150 @@ class TestStatusChecking:
             with patch('time.sleep'):  # Speed up test
                 result = client.wait_for_completion("req123", max_wait=10, poll_interval=0.1)
                 assert result["status"] == "COMPLETED"
+    
+    @patch('core.bria_client.requests.Session.get')
+    def test_wait_for_completion_backoff(self, mock_get):
+        """Test polling backs off between checks and honors Retry-After"""
+        with patch.dict(os.environ, {'BRIA_API_TOKEN': 'test_token'}):
+            client = BRIAAPIClient()
+            
+            throttled = Mock(headers={"Retry-After": "3"})
+            throttled.json.return_value = {"status": "IN_PROGRESS"}
+            in_progress = Mock(headers={})
+            in_progress.json.return_value = {"status": "IN_PROGRESS"}
+            completed = Mock(headers={})
+            completed.json.return_value = {"status": "COMPLETED"}
+            mock_get.side_effect = [in_progress, in_progress, throttled, completed]
+            
+            with patch('time.sleep') as mock_sleep:
+                client.wait_for_completion("req123", max_wait=60, poll_interval=0.5)
+            
+            delays = [call[0][0] for call in mock_sleep.call_args_list]
+            assert delays[0] == 0.5
+            assert delays[1] > delays[0]
+            assert delays[2] == 3.0
+
+
+class TestBatchGeneration:
+    """Test concurrent batch generation"""
+    
+    @patch('core.bria_client.BRIAAPIClient.generate_video_sync')
+    def test_generate_videos_batch(self, mock_generate):
+        """Test batch generation returns results in request order"""
+        mock_generate.side_effect = lambda prompt, **kwargs: f"https://videos/{prompt}.mp4"
+        
+        with patch.dict(os.environ, {'BRIA_API_TOKEN': 'test_token'}):
+            client = BRIAAPIClient()
+            video_urls = client.generate_videos_batch(
+                [{"prompt": scene} for scene in ("one", "two", "three")],
+                max_workers=3
+            )
+        
+        assert video_urls == ["https://videos/one.mp4", "https://videos/two.mp4", "https://videos/three.mp4"]
+        assert client.generate_videos_batch([]) == []
+    
+    @patch('core.bria_client.BRIAAPIClient.generate_video_sync')
+    def test_batch_failure_cancels_pending(self, mock_generate):
+        """Test a failed call stops the batch from starting the calls still queued"""
+        def generate(prompt, **kwargs):
+            if prompt == "bad":
+                raise Exception("BRIA API video generation failed")
+            time.sleep(0.2)
+            return f"https://videos/{prompt}.mp4"
+        mock_generate.side_effect = generate
+        
+        with patch.dict(os.environ, {'BRIA_API_TOKEN': 'test_token'}):
+            client = BRIAAPIClient()
+            with pytest.raises(Exception, match="video generation failed"):
+                client.generate_videos_batch(
+                    [{"prompt": prompt} for prompt in ("bad", "two", "three", "four")],
+                    max_workers=1
+                )
+        
+        # The worker may already have picked up the next call, but no further
+        assert mock_generate.call_count <= 2
+    
+    def test_batch_size_from_env(self):
+        """Test an invalid FIBO_BATCH falls back to the default instead of failing requests"""
+        from core.bria_client import _batch_size_from_env
+        
+        for value, expected in (("3", 3), ("0", 5), ("lots", 5)):
+            with patch.dict(os.environ, {'FIBO_BATCH': value}):
+                assert _batch_size_from_env() == expected
+
+
+class TestRequestCoalescing:
+    """Test identical concurrent requests share one API call"""
+    
+    @patch('core.bria_client.BRIAAPIClient._generate_image_sync')
+    def test_concurrent_identical_generations(self, mock_generate):
+        """Test a request arriving while an identical one runs waits for its result"""
+        import threading
+        joined = threading.Event()
+        
+        class WatchedInflight(dict):
+            """Signals when a second request finds the first one in flight"""
+            def get(self, key, default=None):
+                value = super().get(key, default)
+                if value is not None:
+                    joined.set()
+                return value
+        
+        with patch.dict(os.environ, {'BRIA_API_TOKEN': 'test_token'}):
+            os.environ.pop('BRIA_CACHE_DIR', None)
+            client = BRIAAPIClient()
+            client._inflight = WatchedInflight()
+            results = []
+            second = threading.Thread(target=lambda: results.append(client.generate_image_sync("same prompt")))
+            
+            def slow_generate(*args, **kwargs):
+                # Start the identical request while the first one is still running
+                if mock_generate.call_count == 1:
+                    second.start()
+                    assert joined.wait(5)
+                return Image.new('RGB', (8, 8))
+            mock_generate.side_effect = slow_generate
+            
+            first = client.generate_image_sync("same prompt")
+            second.join(5)
+            
+            # Once nothing is in flight, the next identical request calls the API again
+            client.generate_image_sync("same prompt")
+        
+        assert results == [first]
+        assert mock_generate.call_count == 2
+
+
+class TestImageCache:
+    """Test the opt-in generated image cache"""
+    
+    @patch('core.bria_client.BRIAAPIClient._generate_image_sync')
+    def test_generate_image_cached(self, mock_generate, tmp_path):
+        """Test repeat generations are served from BRIA_CACHE_DIR"""
+        mock_generate.return_value = Image.new('RGB', (8, 8), color='red')
+        
+        with patch.dict(os.environ, {'BRIA_API_TOKEN': 'test_token', 'BRIA_CACHE_DIR': str(tmp_path)}):
+            client = BRIAAPIClient()
+            first = client.generate_image_sync("a red square", width=8, height=8)
+            second = client.generate_image_sync("a red square", width=8, height=8)
+            client.generate_image_sync("a blue square", width=8, height=8)
+        
+        assert mock_generate.call_count == 2
+        assert second.size == first.size
+        assert second.getpixel((0, 0)) == (255, 0, 0)
+    
+    @patch('core.bria_client.BRIAAPIClient._generate_image_sync')
+    def test_cache_off_by_default(self, mock_generate):
+        """Test every generation calls the API without BRIA_CACHE_DIR"""
+        mock_generate.return_value = Image.new('RGB', (8, 8))
+        
+        with patch.dict(os.environ, {'BRIA_API_TOKEN': 'test_token'}):
+            os.environ.pop('BRIA_CACHE_DIR', None)
+            client = BRIAAPIClient()
+            client.generate_image_sync("a red square")
+            client.generate_image_sync("a red square")
+        
+        assert mock_generate.call_count == 2
 
 
 class TestPromptBuilding:
@@ -240,7 +401,7 @@ class TestPromptBuilding:
 class TestVideoGeneration:
     """Test video generation"""
     
-    @patch('core.bria_client.requests.post')
+    @patch('core.bria_client.requests.Session.post')
     def test_generate_video_endpoint(self, mock_post):
         """Test video generation endpoint"""
         with patch.dict(os.environ, {
@@ -266,7 +427,7 @@ class TestVideoGeneration:
             call_url = mock_post.call_args[0][0]
             assert "video/generate/tailored/image-to-video" in call_url
             
-            call_data = mock_post.call_args[1]["json"]
+            call_data = orjson.loads(mock_post.call_args[1]["data"])
             assert call_data["prompt"] == "test video"
             assert call_data["image_url"] == "data:image/png;base64,test"
             assert call_data["duration"] == 3.0
@@ -275,7 +436,7 @@ class TestVideoGeneration:
 class TestErrorHandling:
     """Test error handling"""
     
-    @patch('core.bria_client.requests.post')
+    @patch('core.bria_client.requests.Session.post')
     def test_api_error_handling(self, mock_post):
         """Test API error handling"""
         with patch.dict(os.environ, {
@@ -298,7 +459,7 @@ class TestErrorHandling:
             with pytest.raises(Exception, match="BRIA API HTTP error"):
                 client.generate_image("test", model_id="test_model")
     
-    @patch('core.bria_client.requests.post')
+    @patch('core.bria_client.requests.Session.post')
     def test_connection_error(self, mock_post):
         """Test connection error handling"""
         with patch.dict(os.environ, {
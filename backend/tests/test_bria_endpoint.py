@@ -3,7 +3,10 @@
 Test BRIA API endpoint to find correct format
 """
 import os
+import json
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -40,13 +43,37 @@ test_payload = {
     "height": 512,
     "sync": False
 }
+# Encoded once and shared by every probe
+test_body = json.dumps(test_payload)
 
-for endpoint in test_endpoints:
+# One pooled session, so probes to the same host share connections
+session = requests.Session()
+adapter = HTTPAdapter(pool_connections=4, pool_maxsize=len(test_endpoints))
+session.mount("https://", adapter)
+session.mount("http://", adapter)
+
+
+def probe(endpoint):
+    """POST the test payload to an endpoint, returning its URL and the response (or the error)"""
     url = f"{BASE_URL}{endpoint}" if not endpoint.startswith("http") else endpoint
+    try:
+        return url, session.post(url, data=test_body, headers=headers, timeout=10)
+    except Exception as e:
+        return url, e
+
+
+# Probe every endpoint at once - the wait is the slowest endpoint rather
+# than the sum of all of them. Results are still reported in list order.
+with ThreadPoolExecutor(max_workers=len(test_endpoints)) as executor:
+    results = list(executor.map(probe, test_endpoints))
+session.close()
+
+for endpoint, (url, response) in zip(test_endpoints, results):
     print(f"Testing: {url}")
     
     try:
-        response = requests.post(url, json=test_payload, headers=headers, timeout=10)
+        if isinstance(response, Exception):
+            raise response
         print(f"  Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -2,6 +2,7 @@
 Integration tests for the full storyboard generation pipeline
 """
 import pytest
+import orjson
 import os
 from unittest.mock import patch, MagicMock
 from PIL import Image
@@ -64,6 +65,34 @@ FADE OUT."""
         assert storyboard.frames[0].image is not None
         assert storyboard.frames[0].params is not None
 
+    @patch('core.bria_client.BRIAAPIClient.generate_image_sync')
+    def test_storyboard_batch_size(self, mock_generate):
+        """Test storyboard generation with bounded concurrency keeps scene order"""
+        script_content = """EXT. CITY STREET - NIGHT
+
+Wide establishing shot.
+
+INT. APARTMENT - DAY
+
+Close-up on a window.
+
+EXT. ROOFTOP - DUSK
+
+Aerial shot of the skyline."""
+
+        processor = ScriptProcessor()
+        scenes = processor.parse_script_content(script_content)
+        translator = LLMTranslator(provider="bria")
+        mock_generate.return_value = Image.new('RGB', (64, 36), color='blue')
+
+        generator = FIBOGenerator(api_token="test_token", image_width=64, image_height=36)
+
+        storyboard = generator.create_storyboard(scenes, translator, batch_size=1)
+        assert [f.scene_number for f in storyboard.frames] == [s.number for s in scenes]
+
+        # No scenes should give an empty storyboard rather than an executor error
+        assert generator.create_storyboard([], translator).frames == []
+
 
 class TestEndpointIntegration:
     """Test API endpoint integration"""
@@ -108,7 +137,7 @@ Wide establishing shot. Rain-soaked street, neon signs."""
 class TestBRIAEndpointFormat:
     """Test that BRIA endpoints are called with correct format"""
     
-    @patch('core.bria_client.requests.post')
+    @patch('core.bria_client.requests.Session.post')
     def test_image_endpoint_format(self, mock_post):
         """Verify image generation uses correct endpoint format"""
         with patch.dict(os.environ, {
@@ -135,12 +164,12 @@ class TestBRIAEndpointFormat:
             assert headers["Content-Type"] == "application/json"
             
             # Verify payload
-            payload = mock_post.call_args[1]["json"]
+            payload = orjson.loads(mock_post.call_args[1]["data"])
             assert payload["prompt"] == "test prompt"
             assert "width" in payload
             assert "height" in payload
     
-    @patch('core.bria_client.requests.post')
+    @patch('core.bria_client.requests.Session.post')
     def test_video_endpoint_format(self, mock_post):
         """Verify video generation uses correct endpoint format"""
         with patch.dict(os.environ, {
@@ -161,7 +190,7 @@ class TestBRIAEndpointFormat:
             assert call_url == "https://engine.prod.bria-api.com/v2/video/generate/tailored/image-to-video"
             
             # Verify payload
-            payload = mock_post.call_args[1]["json"]
+            payload = orjson.loads(mock_post.call_args[1]["data"])
             assert payload["prompt"] == "test video"
             assert payload["image_url"] == "data:image/png;base64,test"
 
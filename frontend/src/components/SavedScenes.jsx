@@ -9,6 +9,10 @@ import './StoryboardViewer.css'
 // Use environment variable if set, otherwise use Render backend (production) or localhost (dev)
 const API_BASE_URL = import.meta.env.VITE_API_URL || (import.meta.env.DEV ? 'http://localhost:8000' : 'https://fibo-backend-jb9q.onrender.com')
 
+// Saved scene images are served by the API (e.g. /api/saved-scene/{id}/image);
+// regenerated images are still inline data URLs
+const resolveImageUrl = (url) => (url && url.startsWith('/') ? `${API_BASE_URL}${url}` : url)
+
 function SavedScenes({ onLoadScene }) {
   const [savedScenes, setSavedScenes] = useState([])
   const [loading, setLoading] = useState(true)
@@ -128,7 +132,7 @@ function SavedScenes({ onLoadScene }) {
   const handleDownloadImage = (scene, event) => {
     event.stopPropagation()
     const link = document.createElement('a')
-    link.href = scene.thumbnail
+    link.href = resolveImageUrl(scene.thumbnail)
     link.download = `scene-${scene.scene_number}.png`
     document.body.appendChild(link)
     link.click()
@@ -197,7 +201,7 @@ function SavedScenes({ onLoadScene }) {
             >
               {scene.thumbnail && (
                 <div className="scene-image-container">
-                  <img src={scene.thumbnail} alt={sceneName} />
+                  <img src={resolveImageUrl(scene.thumbnail)} alt={sceneName} />
                 </div>
               )}
               
@@ -307,7 +311,7 @@ function SavedScenes({ onLoadScene }) {
                 <div className="edit-scene-image-preview">
                   <div className="preview-image-container">
                     <img
-                      src={editingScene.thumbnail || editingScene.image}
+                      src={resolveImageUrl(editingScene.thumbnail || editingScene.image)}
                       alt={`Scene ${editingScene.scene_number}`}
                     />
                     {regenerating && (
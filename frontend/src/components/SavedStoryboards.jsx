@@ -7,6 +7,10 @@ import './SavedStoryboards.css'
 // Use environment variable if set, otherwise use Render backend (production) or localhost (dev)
 const API_BASE_URL = import.meta.env.VITE_API_URL || (import.meta.env.DEV ? 'http://localhost:8000' : 'https://fibo-backend-jb9q.onrender.com')
 
+// Frames of saved storyboards reference images served by the API
+// (e.g. /api/saved-storyboard/{id}/frames/frame_0.png); fresh frames are inline data URLs
+const resolveImageUrl = (url) => (url && url.startsWith('/') ? `${API_BASE_URL}${url}` : url)
+
 function SavedStoryboards({ onLoadStoryboard }) {
   const [savedStoryboards, setSavedStoryboards] = useState([])
   const [loading, setLoading] = useState(true)
@@ -139,7 +143,7 @@ function SavedStoryboards({ onLoadStoryboard }) {
 
               {storyboard.thumbnail && (
                 <div className="storyboard-thumbnail">
-                  <img src={storyboard.thumbnail} alt="Thumbnail" />
+                  <img src={resolveImageUrl(storyboard.thumbnail)} alt="Thumbnail" />
                 </div>
               )}
 
@@ -7,6 +7,10 @@ import './StoryboardViewer.css'
 // Use environment variable if set, otherwise use Render backend (production) or localhost (dev)
 const API_BASE_URL = import.meta.env.VITE_API_URL || (import.meta.env.DEV ? 'http://localhost:8000' : 'https://fibo-backend-jb9q.onrender.com')
 
+// Frames of saved storyboards reference images served by the API
+// (e.g. /api/saved-storyboard/{id}/frames/frame_0.png); fresh frames are inline data URLs
+const resolveImageUrl = (url) => (url && url.startsWith('/') ? `${API_BASE_URL}${url}` : url)
+
 function StoryboardViewer({ storyboard, parsedScenes, onSaveStoryboard, onExportPDF, onExportAnimatic, exportLoading, onStoryboardUpdate, isSavedStoryboard = false }) {
   const [saving, setSaving] = useState({})
   const [saved, setSaved] = useState({})
@@ -106,7 +110,7 @@ function StoryboardViewer({ storyboard, parsedScenes, onSaveStoryboard, onExport
 
   const handleDownloadImage = (frame, index) => {
     const link = document.createElement('a')
-    link.href = frame.image
+    link.href = resolveImageUrl(frame.image)
     link.download = `scene-${frame.scene_number}.png`
     document.body.appendChild(link)
     link.click()
@@ -334,7 +338,7 @@ function StoryboardViewer({ storyboard, parsedScenes, onSaveStoryboard, onExport
           <div key={index} className="frame-card">
             <div className="frame-image">
               <img
-                src={frame.image}
+                src={resolveImageUrl(frame.image)}
                 alt={`Scene ${frame.scene_number}`}
                 loading="lazy"
               />
@@ -421,7 +425,7 @@ function StoryboardViewer({ storyboard, parsedScenes, onSaveStoryboard, onExport
                 <div className="edit-scene-image-preview">
                   <div className="preview-image-container">
                     <img
-                      src={storyboard.frames[editingFrame]?.image}
+                      src={resolveImageUrl(storyboard.frames[editingFrame]?.image)}
                       alt={`Scene ${storyboard.frames[editingFrame]?.scene_number}`}
                     />
                     {regenerating[editingFrame] && (